@@ -1,6 +1,9 @@
+import copy
 import logging
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 from tamkin import (
@@ -13,7 +16,8 @@ from tamkin import (
     KineticModel,
     Wigner,
     Eckart,
-    Miller
+    Miller,
+    Molecule,
 )
 
 from ispareto.species import (
@@ -26,6 +30,16 @@ from ispareto.utils import (
 )
 
 
+@lru_cache(maxsize=64)
+def _load_molecule(
+        fchk_file_path: Path, mtime_ns: int, energy: float | None
+) -> Molecule:
+    """Parses a fchk file once for all Kinetics, the modification time in
+    the key invalidates changed files
+    """
+    return load_molecule_g03fchk(fchk_file_path, energy=energy)
+
+
 class Kinetics(ReactionInput, DataOutput):
 
     tunneling_correction: str | None
@@ -39,6 +53,21 @@ class Kinetics(ReactionInput, DataOutput):
     _kinetics_models: dict[Reaction, KineticModel]
     """Holds the constructed Kinetic Model for every Reaction"""
 
+    _k_cache: OrderedDict[tuple[Reaction, float], float]
+    """Rate constants already evaluated per Reaction and temperature, the
+    least recently used are evicted beyond _k_cache_size
+    """
+
+    _k_cache_size: int
+    """Rate constants kept in _k_cache, those of a few temperatures for
+    every Reaction as optimizers propose continuous temperatures
+    """
+
+    _partition_functions: dict[tuple[Species, float | None], PartFun]
+    """Partition function per Species and energy, independent of the
+    tunneling correction and shared with copies from with_tunneling
+    """
+
     def __init__(
             self,
             reactions: list[Reaction],
@@ -52,8 +81,10 @@ class Kinetics(ReactionInput, DataOutput):
         self.gradient_threshold = gradient_threshold
 
         self._kinetics_models = {}
+        self._k_cache = OrderedDict()
+        self._k_cache_size = 4 * len(self.reactions)
+        self._partition_functions = {}
 
-        self._check_input()
         self._construct_kinetics_model()
 
     def __repr__(self) -> str:
@@ -100,13 +131,27 @@ class Kinetics(ReactionInput, DataOutput):
         )
         return tunneling
 
+    def _partition_function(self, species: Species) -> PartFun:
+        """Partition function of one species, species shared by several
+        reactions are constructed only once
+        """
+        # Species equality ignores the energy, which enters the partition
+        # function
+        key = (species, species.energy)
+        partition_function = self._partition_functions.get(key)
+        if partition_function is None:
+            partition_function = self._construct_partition_function(species)
+            self._partition_functions[key] = partition_function
+        return partition_function
+
     def _construct_partition_function(self, species: Species) -> PartFun:
         """Constructs the partition function for one species"""
         partition_function = PartFun(
             NMA(
-                load_molecule_g03fchk(
+                _load_molecule(
                     species.fchk_file_path,
-                    energy=species.energy
+                    species.fchk_file_path.stat().st_mtime_ns,
+                    species.energy,
                 ),
                 ConstrainExt(
                     gradient_threshold=self.gradient_threshold
@@ -130,21 +175,15 @@ class Kinetics(ReactionInput, DataOutput):
             transition_state = reaction.transition_state
 
             for reactant in reactants:
-                reactants_pfs.append(
-                    self._construct_partition_function(reactant)
-                )
+                reactants_pfs.append(self._partition_function(reactant))
 
             # Product Partition Functions are only needed for eckart
             # Tunneling correction, otherwise -> unnecessary construction
             if self.tunneling_correction == "eckart":
                 for product in products:
-                    product_pfs.append(
-                        self._construct_partition_function(product)
-                    )
+                    product_pfs.append(self._partition_function(product))
 
-            transition_state_pf = self._construct_partition_function(
-                transition_state
-            )
+            transition_state_pf = self._partition_function(transition_state)
 
             kinetic_model = KineticModel(
                 reactants_pfs,
@@ -161,27 +200,67 @@ class Kinetics(ReactionInput, DataOutput):
                 f"Constructed Kinetics Model for {Reaction}."
             )
 
+    def with_tunneling(self, tunneling_correction: str | None) -> "Kinetics":
+        """Returns a copy with another tunneling correction. The partition
+        functions are shared, only the kinetic models are rebuilt.
+        """
+        kinetics = copy.copy(self)
+        kinetics.tunneling_correction = tunneling_correction
+        kinetics._kinetics_models = {}
+        kinetics._k_cache = OrderedDict()
+        kinetics._construct_kinetics_model()
+        return kinetics
+
     def k(self, reaction: Reaction, temperature: float) -> float:
         """Returns the rate constant for given species and temperature in SI
         units
         """
-        kinetic_model = self._kinetics_models[reaction]
-        k = kinetic_model.rate_constant(temperature)
-        k_si = k / kinetic_model.unit
+        key = (reaction, temperature)
+        k_si = self._k_cache.get(key)
+        if k_si is None:
+            kinetic_model = self._kinetics_models[reaction]
+            k = kinetic_model.rate_constant(temperature)
+            k_si = k / kinetic_model.unit
+            self._k_cache[key] = k_si
+            if len(self._k_cache) > self._k_cache_size:
+                self._k_cache.popitem(last=False)
+        else:
+            self._k_cache.move_to_end(key)
         return k_si
 
+    def k_batch(
+            self, reaction: Reaction, temperatures: np.ndarray
+    ) -> np.ndarray:
+        """Returns the rate constants of one reaction for an array of
+        temperatures in SI units. Sweeps bypass the cache of k.
+        """
+        kinetic_model = self._kinetics_models[reaction]
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        k = np.fromiter(
+            (kinetic_model.rate_constant(t) for t in temperatures.flat),
+            dtype=np.float64,
+            count=temperatures.size,
+        )
+        return k.reshape(temperatures.shape) / kinetic_model.unit
+
+    def k_all(self, temperature: float) -> np.ndarray:
+        """Returns the rate constants of all reactions at one temperature in
+        SI units, ordered as the reactions
+        """
+        return np.fromiter(
+            (self.k(reaction, temperature) for reaction in self.reactions),
+            dtype=np.float64,
+            count=len(self.reactions),
+        )
+
     def dump(self, path: Path) -> None:
         """Dumps the kinetics"""
         temperature_range = np.linspace(50, 2500, 2450)
         kinetics = {}
         for reaction in self.reactions:
-            rates = []
-            for temp in temperature_range:
-                k = self.k(reaction, temp)
-                rates.append(k)
             kinetics[reaction.name] = {
                 'temperature': temperature_range.tolist(),
-                'rate_constants': rates
+                'rate_constants': self.k_batch(reaction, temperature_range)
             }
         df_list = []
         for reaction_name, data in kinetics.items():
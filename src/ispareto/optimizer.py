@@ -1,7 +1,9 @@
+import csv
 import logging
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import TextIO
 from dataclasses import dataclass
 from abc import abstractmethod, ABC
 from summit.domain import (
@@ -80,8 +82,11 @@ class Optimizer(ABC):
     output_directory: Path
     """Stores the data and plots in this directory"""
 
-    results: pd.DataFrame
-    """Dataframe holding the results"""
+    _results_array: np.ndarray
+    """Preallocated buffer holding the results, one row per iteration"""
+
+    _num_results: int = 0
+    """Number of filled rows in the results buffer"""
 
     _results_columns_names: list[str] = [
         "Temperature",
@@ -101,6 +106,11 @@ class Optimizer(ABC):
     _output_data_directory: Path
     """Output Data Storage"""
 
+    _results_file: TextIO
+    """Results CSV file, open during run, one row is appended per
+    iteration
+    """
+
     _visualization: Visualization
     """Visualization of the Pareto Front"""
 
@@ -121,9 +131,15 @@ class Optimizer(ABC):
         self.output_directory = output_directory
         self._log_level = log_level
 
-        self.results = pd.DataFrame(
-            columns=self._results_columns_names
+        self._results_array = np.empty(
+            (
+                max(num_initial_points or 0, 64),
+                len(self._results_columns_names),
+            ),
+            dtype=np.float64,
         )
+        self._num_results = 0
+
         self._setup_logger()
         self._log_start()
 
@@ -145,6 +161,26 @@ class Optimizer(ABC):
     def __repr__(self) -> str:
         """Optimizer"""
 
+    @property
+    def results(self) -> pd.DataFrame:
+        """Dataframe holding the results"""
+        return pd.DataFrame(
+            self._results_array[:self._num_results],
+            columns=self._results_columns_names,
+        )
+
+    def _reserve_results(self, capacity: int) -> None:
+        """Grows the results buffer to hold at least capacity rows"""
+        if capacity <= len(self._results_array):
+            return
+        results_array = np.empty(
+            (capacity, len(self._results_columns_names)), dtype=np.float64
+        )
+        results_array[:self._num_results] = (
+            self._results_array[:self._num_results]
+        )
+        self._results_array = results_array
+
     def _setup_logger(self) -> None:
         """Adds a console and file handler"""
         self._logger.handlers = []
@@ -259,8 +295,10 @@ class Optimizer(ABC):
         summary = "\n\n===== OPTIMIZATION SUMMARY =====\n\n"
         summary += f"Total iterations: {self._counter}\n\n"
 
-        best_sty_idx = self.results[self._results_columns_names[4]].idxmax()
-        best_sty_row = self.results.iloc[best_sty_idx]
+        results = self.results
+
+        best_sty_idx = results[self._results_columns_names[4]].idxmax()
+        best_sty_row = results.iloc[best_sty_idx]
 
         summary += "BEST SPACE TIME YIELD (STY) SOLUTION:\n"
         summary += (
@@ -291,8 +329,8 @@ class Optimizer(ABC):
             f"{best_sty_row[self._results_columns_names[3]]:.2f} minutes\n\n"
         )
 
-        best_e_idx = self.results[self._results_columns_names[5]].idxmin()
-        best_e_row = self.results.iloc[best_e_idx]
+        best_e_idx = results[self._results_columns_names[5]].idxmin()
+        best_e_row = results.iloc[best_e_idx]
 
         summary += "BEST E-FACTOR SOLUTION:\n"
         summary += (
@@ -327,20 +365,20 @@ class Optimizer(ABC):
         summary += (
             f"    "
             f"STY Range: "
-            f"[{self.results[self._results_columns_names[4]].min():.4e}, "
-            f"{self.results[self._results_columns_names[4]].max():.4e}]\n"
+            f"[{results[self._results_columns_names[4]].min():.4e}, "
+            f"{results[self._results_columns_names[4]].max():.4e}]\n"
         )
         summary += (
             f"    "
             f"E-factor Range: "
-            f"[{self.results[self._results_columns_names[5]].min():.4f}, "
-            f"{self.results[self._results_columns_names[5]].max():.4f}]\n"
+            f"[{results[self._results_columns_names[5]].min():.4f}, "
+            f"{results[self._results_columns_names[5]].max():.4f}]\n"
         )
         summary += (
             f"    "
             f"Temperature Range: "
-            f"[{self.results[self._results_columns_names[0]].min():.2f}, "
-            f"{self.results[self._results_columns_names[0]].max():.2f}] °C\n"
+            f"[{results[self._results_columns_names[0]].min():.2f}, "
+            f"{results[self._results_columns_names[0]].max():.2f}] °C\n"
         )
         summary += (
             f"    "
@@ -371,11 +409,30 @@ class Optimizer(ABC):
         )
         return reactor_conditions
 
-    def _store_results(self) -> None:
-        self.results.to_csv(
-            self._output_data_directory / "ispareto.csv",
-            index=False,
-        )
+    def _open_results_file(self) -> None:
+        """Opens the results CSV file and writes the header, the file is
+        closed by _close at the end of run
+        """
+        self._results_file = open(
+            self._output_data_directory / "ispareto.csv", "w", newline=""
+        )
+        self._results_writer = csv.writer(self._results_file)
+        self._results_writer.writerow(self._results_columns_names)
+        self._results_file.flush()
+
+    def _close(self) -> None:
+        """Closes the results file and waits for the plots, also when the
+        run aborts
+        """
+        try:
+            self._results_file.close()
+        finally:
+            self._visualization.close()
+
+    def _store_results(self, row: np.ndarray) -> None:
+        """Appends one row to the results CSV file"""
+        self._results_writer.writerow(row.tolist())
+        self._results_file.flush()
 
     def _add_to_result(
             self,
@@ -383,33 +440,25 @@ class Optimizer(ABC):
             STY: float,
             conditions: _OptimizerConditions,
     ) -> None:
-        """Adds the results to the Dataframe"""
-        results_columns_dataframe = pd.DataFrame(
-            [
-                {
-                    self._results_columns_names[0]: conditions.temperature,
-                    self._results_columns_names[1]: (
-                        conditions.concentration_reactant_1
-                    ),
-                    self._results_columns_names[2]: (
-                        conditions.concentration_ratio
-                    ),
-                    self._results_columns_names[3]: conditions.time,
-                    self._results_columns_names[4]: STY,
-                    self._results_columns_names[5]: E,
-                }
-            ]
-        )
-        self.results = pd.concat(
-            [self.results, results_columns_dataframe],
-            ignore_index=True,
+        """Adds the results to the results buffer"""
+        if self._num_results == len(self._results_array):
+            self._reserve_results(2 * len(self._results_array))
+
+        self._results_array[self._num_results] = (
+            conditions.temperature,
+            conditions.concentration_reactant_1,
+            conditions.concentration_ratio,
+            conditions.time,
+            STY,
+            E,
         )
+        self._num_results += 1
 
         self._counter += 1
-        self._store_results()
+        self._store_results(self._results_array[self._num_results - 1])
         self._visualization.plot(
-            e=np.array(self.results[self._results_columns_names[-1]].values),
-            sty=np.array(self.results[self._results_columns_names[-2]].values),
+            e=self._results_array[:self._num_results, -1],
+            sty=self._results_array[:self._num_results, -2],
             iteration=self._counter,
         )
 
@@ -573,8 +622,13 @@ class SummitOptimizer(Optimizer):
 
     def run(self, num_iterations: int) -> None:
         """Runs the Summit optimizer"""
-        self._run_lhs()
-        self._run_optimizer(num_iterations=num_iterations)
+        self._reserve_results(self.num_initial_points + num_iterations)
+        self._open_results_file()
+        try:
+            self._run_lhs()
+            self._run_optimizer(num_iterations=num_iterations)
+        finally:
+            self._close()
         self._end()
 
 class TSEmoOptimizer(SummitOptimizer):
@@ -775,17 +829,22 @@ class NSGA2Optimizer(Optimizer):
     def run(self, num_iterations: int) -> None:
         """Runs the Pymoo optimizer."""
         num_generations = num_iterations // self._pop_size
+        self._reserve_results(num_generations * self._pop_size)
         problem = self._PymooProblem(self)
         algorithm = NSGA2(
             pop_size=self._pop_size,
         )
 
-        minimize(
-            problem,
-            algorithm,
-            ("n_gen", num_generations),
-            verbose=False,
-            seed=42,
-        )
+        self._open_results_file()
+        try:
+            minimize(
+                problem,
+                algorithm,
+                ("n_gen", num_generations),
+                verbose=False,
+                seed=42,
+            )
+        finally:
+            self._close()
 
         self._end()
@@ -1,11 +1,13 @@
 import logging
+import numpy as np
 from dataclasses import dataclass
 
-from pyomo.core import BuildAction, TransformationFactory
-from pyomo.opt import SolverFactory
+from pyomo.core import TransformationFactory
+from pyomo.opt import SolverFactory, TerminationCondition
 from pyomo.environ import (
     ConcreteModel,
     Var,
+    Param,
     NonNegativeReals,
     Constraint,
     value,
@@ -46,6 +48,25 @@ class Reactor(ReactionInput):
     solvation: Solvation
     """Solvation delta G"""
 
+    _model: ConcreteModel
+    """Discretized pyomo reactor, built once and reused by every simulation"""
+
+    _species_index: dict[Species, int]
+    """Row of every species in the stoichiometry matrix"""
+
+    _stoichiometry_csr: tuple[np.ndarray, np.ndarray, list[float]]
+    """Stoichiometry matrix (species x reactions) in CSR form as row
+    pointers, reaction indices and coefficients, zeros are not stored
+    """
+
+    _reaction_reactants: tuple[tuple[Species, ...], ...]
+    """Reactants of every reaction entering the mass action rate"""
+
+    _warm_start: bool
+    """The values in the model come from an optimal solve and are the
+    initial point of the next solve
+    """
+
     def __init__(
             self,
             reactions: list[Reaction],
@@ -60,6 +81,11 @@ class Reactor(ReactionInput):
         self.solvation = solvation
         self.conditions = None
 
+        self._build_stoichiometry()
+        self._model = self._setup_reactor()
+        self._solver = SolverFactory("ipopt")
+        self._warm_start = False
+
     def __repr__(self):
         string = "\n\nREACTOR:\n"
         string += f"  Num Reactions: {len(self.reactions)}\n"
@@ -88,18 +114,44 @@ class Reactor(ReactionInput):
         )
         return conditions_converted
 
+    def _build_stoichiometry(self) -> None:
+        """Collects the stoichiometry of all reactions into a sparse CSR
+        matrix, every mass balance then only visits the reactions its
+        species takes part in
+        """
+        self._species_index = {
+            species: row for row, species in enumerate(self.species)
+        }
+        rows, columns, coefficients = [], [], []
+        for column, reaction in enumerate(self.reactions):
+            for species, coefficient in reaction.stoichiometry.items():
+                rows.append(self._species_index[species])
+                columns.append(column)
+                coefficients.append(coefficient)
+
+        order = np.lexsort((columns, rows))
+        indptr = np.zeros(len(self._species_index) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(rows, minlength=len(self._species_index)),
+            out=indptr[1:],
+        )
+        self._stoichiometry_csr = (
+            indptr,
+            np.asarray(columns, dtype=np.int64)[order],
+            [coefficients[i] for i in order],
+        )
+        self._reaction_reactants = tuple(
+            tuple(reaction.reactants) for reaction in self.reactions
+        )
+
     def __rate_rule(
             self,
             model: ConcreteModel,
-            reaction: Reaction,
+            reaction_index: int,
             time: float
     ) -> float:
-        k = self.kinetics.k(reaction, self.conditions.temperature)
-        correction = self.solvation.correction_factor(
-            reaction, self.conditions.temperature
-        )
-        rate = k * correction
-        for reactant in reaction.reactants:
+        rate = model.k[reaction_index]
+        for reactant in self._reaction_reactants[reaction_index]:
             rate *= model.C[reactant, time]
         return rate
 
@@ -109,33 +161,69 @@ class Reactor(ReactionInput):
             species: Species,
             time: float,
     ) -> bool:
-        return model.dCdt[species, time] == sum(
-            reaction.coefficient(species) * self.__rate_rule(
-                model, reaction, time
+        indptr, reaction_indices, coefficients = self._stoichiometry_csr
+        row = self._species_index[species]
+        # Time is scaled to [0, 1], the residence time enters as parameter
+        return model.dCdt[species, time] == model.time * sum(
+            coefficients[entry] * self.__rate_rule(
+                model, int(reaction_indices[entry]), time
             )
-            for reaction in self.reactions
+            for entry in range(indptr[row], indptr[row + 1])
         )
 
-    def __init_conditions(self, model) -> None:
+    def __init_conditions(self, model: ConcreteModel) -> None:
+        model.time = self.conditions.time
+        for reaction_index, reaction in enumerate(self.reactions):
+            k = self.kinetics.k(reaction, self.conditions.temperature)
+            correction = self.solvation.correction_factor(
+                reaction, self.conditions.temperature
+            )
+            model.k[reaction_index] = k * correction
+
         for species in self.species:
             concentration = self.conditions.concentrations.get(species, 0.0)
             model.C[species, 0].fix(concentration)
 
+    def __init_initial_point(self, model: ConcreteModel) -> None:
+        """Starts every concentration at its initial value with no change
+        over time, independent of previous solves
+        """
+        for species in self.species:
+            concentration = self.conditions.concentrations.get(species, 0.0)
+            for time in model.t:
+                model.C[species, time].set_value(concentration)
+                model.dCdt[species, time].set_value(0.0)
+
+    def reset_initial_point(self) -> None:
+        """The next simulation starts from the initial concentrations
+        instead of the previous solution
+        """
+        self._warm_start = False
+
     def _setup_reactor(self) -> ConcreteModel:
-        """Setup the pyomo reactor"""
+        """Setup and discretize the pyomo reactor on a dimensionless time
+        axis, conditions are applied as parameters before every solve
+        """
         model = ConcreteModel()
-        model.t = ContinuousSet(bounds=(0, self.conditions.time))
+        model.t = ContinuousSet(bounds=(0, 1))
+        model.time = Param(initialize=1.0, mutable=True)
+        model.k = Param(
+            range(len(self.reactions)), initialize=0.0, mutable=True
+        )
         model.C = Var(self.species, model.t, domain=NonNegativeReals)
         model.dCdt = DerivativeVar(model.C, wrt=model.t)
         model.mass_balance = Constraint(
             self.species, model.t, rule=self.__mass_balance
         )
-        model.init = BuildAction(rule=lambda m: self.__init_conditions(m))
+
+        TransformationFactory(
+            "dae.finite_difference"
+        ).apply_to(model, nfe=400, scheme="BACKWARD")
         return model
 
     def _extract_results(self, model: ConcreteModel) -> tuple[float, float]:
         concentration = {
-            sp: value(model.C[sp, self.conditions.time])
+            sp: value(model.C[sp, model.t.last()])
             for sp in self.species
         }
         mass_product = sum(
@@ -160,13 +248,20 @@ class Reactor(ReactionInput):
     def simulate(self, conditions: ReactorConditions) -> tuple[float, float]:
         """Returns E and STY for given starting conditions"""
         self._convert_conditions(conditions)
-        model = self._setup_reactor()
-
-        TransformationFactory(
-            "dae.finite_difference"
-        ).apply_to(model, nfe=400, scheme="BACKWARD")
-        solver = SolverFactory("ipopt")
-        solver.solve(model, tee=False)
+        self.__init_conditions(self._model)
+        # The concentrations of the previous optimal solve remain in the
+        # model and are the initial point of IPOPT, any other outcome
+        # must not leak into the next simulation
+        if not self._warm_start:
+            self.__init_initial_point(self._model)
+        results = self._solver.solve(self._model, tee=False)
+        termination = results.solver.termination_condition
+        self._warm_start = termination == TerminationCondition.optimal
+        if not self._warm_start:
+            self._logger.warning(
+                f"Reactor solve terminated with {termination}, the next "
+                f"simulation starts from the initial concentrations"
+            )
 
-        return self._extract_results(model)
+        return self._extract_results(self._model)
 
@@ -1,6 +1,8 @@
 import logging
+import math
 import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
 from ispareto.species import (
@@ -10,17 +12,73 @@ from ispareto.species import (
 from ispareto.utils import (
     ReactionInput,
     DataOutput,
+    njit,
 )
 
 
+@njit(cache=True)
+def _interp(x: float, xp: np.ndarray, fp: np.ndarray) -> float:
+    """Scalar linear interpolation with the same clamping as np.interp,
+    xp has to be sorted in increasing order
+    """
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[-1]:
+        return fp[-1]
+    i = np.searchsorted(xp, x)
+    t = (x - xp[i - 1]) / (xp[i] - xp[i - 1])
+    return fp[i - 1] + t * (fp[i] - fp[i - 1])
+
+
+@lru_cache(maxsize=64)
+def _read_cosmo_therm_file(
+        tab_file_path: Path, mtime_ns: int
+) -> tuple[tuple[float, float], ...]:
+    """Temperature and gsolv pairs of a COSMOtherm tab file, parsed once for
+    all Solvation, the modification time in the key invalidates changed files
+    """
+    temperature_g_solve = {}
+    content = tab_file_path.read_text()
+    lines = content.split("\n")
+
+    temperature = None
+
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+
+        if "Settings " in line:
+            parts = line.split(";")[0]
+            parts = parts.split("=")[1]
+            parts = parts.strip()
+            parts = parts.replace("K", "")
+            temperature = float(parts)
+
+        if "Compound" in line:
+            parts = lines[i+2].split()
+            parts = parts[5]
+            gsolv = float(parts)
+            temperature_g_solve[temperature] = gsolv
+            temperature = None
+
+    return tuple(temperature_g_solve.items())
+
+
 class Solvation(ReactionInput, DataOutput):
 
     gas_constant = 8.3145  # J/mol/K
     """Gas Constant"""
 
+    kcal_to_joule = 4184.0  # J/kcal
+    """Conversion factor from kcal to J"""
+
     _g_values: dict[Species, dict[float, float]]
     """G Values mapping dict[Species, dict[temperature, gsolv]]"""
 
+    _g_arrays: dict[Species, tuple[np.ndarray, np.ndarray]]
+    """Sorted temperature and gsolv arrays for the interpolation"""
+
     def __init__(
         self,
         reactions: list[Reaction],
@@ -29,6 +87,7 @@ class Solvation(ReactionInput, DataOutput):
         self._logger = logging.getLogger(__name__)
 
         self._g_values = {}
+        self._g_arrays = {}
         self._extract_g()
 
     def __repr__(self) -> str:
@@ -40,30 +99,12 @@ class Solvation(ReactionInput, DataOutput):
         return string
 
     def _parse_cosmo_therm_file(self, species: Species) -> dict[float, float]:
-        temperature_g_solve = {}
-        content = species.tab_file_path.read_text()
-        lines = content.split("\n")
-
-        temperature = None
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-
-            if "Settings " in line:
-                parts = line.split(";")[0]
-                parts = parts.split("=")[1]
-                parts = parts.strip()
-                parts = parts.replace("K", "")
-                temperature = float(parts)
-
-            if "Compound" in line:
-                parts = lines[i+2].split()
-                parts = parts[5]
-                gsolv = float(parts)
-                temperature_g_solve[temperature] = gsolv
-                temperature = None
+        tab_file_path = species.tab_file_path
+        temperature_g_solve = dict(
+            _read_cosmo_therm_file(
+                tab_file_path, tab_file_path.stat().st_mtime_ns
+            )
+        )
 
         self._logger.debug(
             f"Extracted {len(temperature_g_solve)} Temperature G Solvation "
@@ -76,7 +117,16 @@ class Solvation(ReactionInput, DataOutput):
         all_species = self.species.copy()
         all_species.update(self.transition_states)
         for species in all_species:
-            self._g_values[species] = self._parse_cosmo_therm_file(species)
+            g_values = self._parse_cosmo_therm_file(species)
+            temperatures = np.array(list(g_values.keys()), dtype=np.float64)
+            order = np.argsort(temperatures)
+            self._g_values[species] = g_values
+            self._g_arrays[species] = (
+                np.ascontiguousarray(temperatures[order]),
+                np.ascontiguousarray(
+                    np.array(list(g_values.values()), dtype=np.float64)[order]
+                ),
+            )
 
         self._logger.debug(
             f"Extracted G Solvation values for {len(self._g_values)} species"
@@ -84,13 +134,13 @@ class Solvation(ReactionInput, DataOutput):
 
     def _g(self, species: Species, temperature: float) -> float:
         """Obtain G for one species"""
-        return float(
-            np.interp(
-                temperature,
-                list(self._g_values[species].keys()),
-                list(self._g_values[species].values()),
-            )
-        )
+        return float(_interp(temperature, *self._g_arrays[species]))
+
+    def _g_batch(
+            self, species: Species, temperatures: np.ndarray
+    ) -> np.ndarray:
+        """Obtain G for one species at an array of temperatures"""
+        return np.interp(temperatures, *self._g_arrays[species])
 
     def correction_factor(
             self, reaction: Reaction, temperature: float
@@ -100,14 +150,57 @@ class Solvation(ReactionInput, DataOutput):
         transition_state = reaction.transition_state
 
         g_reactants = sum(
-            [self._g(reactant, temperature) for reactant in reactants]
+            self._g(reactant, temperature) for reactant in reactants
         )
         g_transition_state = self._g(transition_state, temperature)
 
         delta_g = g_transition_state - g_reactants
-        delta_g_si_units = delta_g * 4184
+        delta_g_si_units = delta_g * self.kcal_to_joule
 
-        return np.exp(-delta_g_si_units / (self.gas_constant * temperature))
+        # Scalar path, math.exp avoids the NumPy scalar dispatch
+        return math.exp(
+            -delta_g_si_units / (self.gas_constant * temperature)
+        )
+
+    def correction_factor_batch(
+            self, reaction: Reaction, temperatures: np.ndarray
+    ) -> np.ndarray:
+        """Obtain the correction factors of one reaction at an array of
+        temperatures
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        # (reactants x temperatures) reduced in one pass, 0 without reactants
+        g_reactants = np.sum(
+            [
+                self._g_batch(reactant, temperatures)
+                for reactant in reaction.reactants
+            ],
+            axis=0,
+        )
+        g_transition_state = self._g_batch(
+            reaction.transition_state, temperatures
+        )
+
+        delta_g = g_transition_state - g_reactants
+        delta_g_si_units = delta_g * self.kcal_to_joule
+
+        return np.exp(
+            -delta_g_si_units / (self.gas_constant * temperatures)
+        )
+
+    def correction_factor_matrix(
+            self, reactions: list[Reaction], temperatures: np.ndarray
+    ) -> np.ndarray:
+        """Obtain the correction factors of several reactions at an array of
+        temperatures as (reactions x temperatures) array
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        factors = np.empty((len(reactions), temperatures.size))
+        for row, reaction in enumerate(reactions):
+            factors[row] = self.correction_factor_batch(
+                reaction, temperatures
+            )
+        return factors
 
     def _dump_gsolv(self, path: Path) -> None:
         g_values = {
@@ -121,14 +214,15 @@ class Solvation(ReactionInput, DataOutput):
         """Dumps the correction factors for each reaction at various
         temperatures to a CSV file.
         """
-        all_temps = list(self._g_values.values())[0].keys()
-
-        correction_values = {}
-        for reaction in self.reactions:
-            correction_values[reaction.name] = {}
-            for temp in all_temps:
-                correction = self.correction_factor(reaction, temp)
-                correction_values[reaction.name][temp] = correction
+        all_temps = list(list(self._g_values.values())[0].keys())
+
+        corrections = self.correction_factor_matrix(
+            self.reactions, np.array(all_temps)
+        )
+        correction_values = {
+            reaction.name: dict(zip(all_temps, row))
+            for reaction, row in zip(self.reactions, corrections.tolist())
+        }
 
         df = pd.DataFrame.from_dict(correction_values, orient="index")
         df.to_csv(path / "corrections.csv")
@@ -1,9 +1,68 @@
 import logging
+import numpy as np
 from pathlib import Path
+from typing import Callable, Iterable
+
+_logger: logging.Logger = logging.getLogger(__name__)
+"""Logger shared by all Species and Reactions"""
+
+_species_registry: dict[tuple, "Species"] = {}
+"""Canonical Species instances created via Species.get_or_create"""
+
+
+def _dispatch(table: dict[type, Callable], other) -> Callable | None:
+    """Look up the arithmetic handler for the type of other. Subclasses
+    resolve to the handler of their closest registered base class.
+    """
+    cls = type(other)
+    handler = table.get(cls)
+    if handler is None:
+        for base in cls.__mro__[1:]:
+            if base in table:
+                handler = table[cls] = table[base]
+                break
+    return handler
+
+
+def _merge_into(
+        stoichiometry: dict["Species", int],
+        terms: Iterable[tuple["Species", int]],
+) -> dict["Species", int]:
+    """Add the coefficients of terms to stoichiometry in place. Species
+    cancelling out are dropped in the same pass.
+    """
+    for species, coefficient in terms:
+        value = stoichiometry.get(species, 0) + coefficient
+        if value:
+            stoichiometry[species] = value
+        else:
+            stoichiometry.pop(species, None)
+    return stoichiometry
+
+
+def _merged(
+        stoichiometry: dict["Species", int],
+        terms: Iterable[tuple["Species", int]],
+) -> dict["Species", int]:
+    """Copy of stoichiometry with the coefficients of terms added, the
+    result can be passed to Reaction with _pre_filtered=True.
+    """
+    return _merge_into(dict(stoichiometry), terms)
+
 
 class Species:
     """Abstract class for species"""
 
+    __slots__ = (
+        "name",
+        "mass",
+        "energy",
+        "tab_file_path",
+        "fchk_file_path",
+        "_key",
+        "_hash",
+    )
+
     name: str
     """Name Identifier for the Species"""
 
@@ -19,6 +78,9 @@ class Species:
     tab_file_path: Path
     """Cosmotherm Tab File Path"""
 
+    _logger: logging.Logger = _logger
+    """Module logger, no logger is created per Species"""
+
     def __init__(
             self,
             name: str,
@@ -27,25 +89,31 @@ class Species:
             tab_file_path: Path,
             energy: float | None = None
     ):
-        self._logger: logging.Logger = logging.getLogger(
-            f"Species('{name}')"
-        )
-
         self.name = name
         self.mass = mass
         self.energy = energy
         self.tab_file_path = tab_file_path
         self.fchk_file_path = fchk_file_path
-
-        if not self.fchk_file_path.exists():
-            raise FileNotFoundError(
-                f"FCHK File not found: {self.fchk_file_path}"
-            )
-
-        if not self.tab_file_path.exists():
-            raise FileNotFoundError(
-                f"TAB File not found: {self.tab_file_path}"
-            )
+        # Existence of the files is checked in bulk by ReactionInput
+
+        # Species are used as dict keys, the identifying fields are not
+        # changed after construction so the key and its hash are computed
+        # only once, the path is converted to str here and not per __eq__
+        self._key = (self.name, self.mass, str(self.fchk_file_path))
+        self._hash = hash(self._key)
+
+    @classmethod
+    def get_or_create(cls, *args, **kwargs) -> "Species":
+        """Return the canonical instance of the Species the constructor
+        arguments describe.
+
+        Calls constructing equal Species, same name, mass and fchk path,
+        return the first created object, so dict lookups on
+        stoichiometries short circuit on identity. Species constructed
+        directly are not interned.
+        """
+        species = cls(*args, **kwargs)
+        return _species_registry.setdefault((cls, species._key), species)
 
     def __repr__(self) -> str:
         """Return string representation of the Species"""
@@ -59,63 +127,77 @@ class Species:
         return ", ".join(parts) + ")"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Species):
             return False
-        return (
-            self.name == other.name and
-            self.mass == other.mass and
-            self.fchk_file_path == other.fchk_file_path
+        return self._key == other._key
+
+    def _add_species(self, other: "Species") -> "Reaction":
+        return Reaction(
+            stoichiometry={
+                self: 1,
+                other: 1
+            }
         )
 
+    def _add_term(self, other: "ReactionTerm") -> "Reaction":
+        return ReactionTerm(species=self, coefficient=1) + other
+
+    def _add_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(other.stoichiometry, ((self, 1),))
+        return Reaction(stoichiometry=result, _pre_filtered=True)
+
+    def _sub_species(self, other: "Species") -> "Reaction":
+        return Reaction(
+            stoichiometry={
+                self: 1,
+                other: -1
+            }
+        )
+
+    def _sub_term(self, other: "ReactionTerm") -> "Reaction":
+        return ReactionTerm(species=self, coefficient=1) - other
+
+    def _sub_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(
+            {k: -v for k, v in other.stoichiometry.items()}, ((self, 1),)
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
+
     def __add__(self, other):
-        if isinstance(other, Species):
-            return Reaction(
-                stoichiometry={
-                    self: 1,
-                    other: 1
-                }
-            )
-        elif isinstance(other, ReactionTerm):
-            return ReactionTerm(species=self, coefficient=1) + other
-        elif isinstance(other, Reaction):
-            result = other.stoichiometry.copy()
-            result[self] = result.get(self, 0) + 1
-            return Reaction(stoichiometry=result)
-        else:
+        handler = _dispatch(self._add_dispatch, other)
+        if handler is None:
             raise TypeError(f"Cannot add Species to {type(other)}")
+        return handler(self, other)
 
     def __sub__(self, other):
-        if isinstance(other, Species):
-            return Reaction(
-                stoichiometry={
-                    self: 1,
-                    other: -1
-                }
-            )
-        elif isinstance(other, ReactionTerm):
-            return ReactionTerm(species=self, coefficient=1) - other
-        elif isinstance(other, Reaction):
-            result = {k: -v for k, v in other.stoichiometry.items()}
-            result[self] = result.get(self, 0) + 1
-            return Reaction(stoichiometry=result)
-        else:
+        handler = _dispatch(self._sub_dispatch, other)
+        if handler is None:
             raise TypeError(f"Cannot subtract {type(other)} from Species")
+        return handler(self, other)
 
     def __hash__(self):
-        return hash((self.name, self.mass, str(self.fchk_file_path)))
+        return self._hash
 
 
 class Reactant(Species):
     """Reactants"""
 
+    __slots__ = ()
+
 
 class Product(Species):
     """Products"""
 
+    __slots__ = ()
+
 
 class TransitionState(Species):
     """Transition states"""
 
+    __slots__ = ()
+
     def __init__(
             self,
             name: str,
@@ -143,78 +225,155 @@ class ReactionTerm:
     coefficient
     """
 
+    __slots__ = ("species", "coefficient")
+
     def __init__(self, species, coefficient):
         self.species = species
         self.coefficient = coefficient
 
-    def __add__(self, other):
-        if isinstance(other, ReactionTerm):
-            return Reaction(
-                stoichiometry=
-                {
-                    self.species: self.coefficient,
-                    other.species: other.coefficient
-                }
-            )
+    def _add_term(self, other: "ReactionTerm") -> "Reaction":
+        return Reaction(
+            stoichiometry=
+            {
+                self.species: self.coefficient,
+                other.species: other.coefficient
+            }
+        )
 
-        elif isinstance(other, Reaction):
-            result = other.stoichiometry.copy()
-            result[self.species] = result.get(
-                self.species, 0
-            ) + self.coefficient
-            return Reaction(stoichiometry=result)
-        else:
+    def _add_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(
+            other.stoichiometry, ((self.species, self.coefficient),)
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
+
+    def _sub_term(self, other: "ReactionTerm") -> "Reaction":
+        return Reaction(
+            stoichiometry=
+            {
+                self.species: self.coefficient,
+                other.species: -other.coefficient
+            }
+        )
+
+    def _sub_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(
+            {k: -v for k, v in other.stoichiometry.items()},
+            ((self.species, self.coefficient),),
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
+
+    def __add__(self, other):
+        handler = _dispatch(self._add_dispatch, other)
+        if handler is None:
             raise TypeError(f"Cannot add ReactionTerm to {type(other)}")
+        return handler(self, other)
 
     def __sub__(self, other):
-        if isinstance(other, ReactionTerm):
-            return Reaction(
-                stoichiometry=
-                {
-                    self.species: self.coefficient,
-                    other.species: -other.coefficient
-                }
-            )
-
-        elif isinstance(other, Reaction):
-            result = {k: -v for k, v in other.stoichiometry.items()}
-            result[self.species] = result.get(
-                self.species,  0
-            ) + self.coefficient
-            return Reaction(stoichiometry=result)
-        else:
+        handler = _dispatch(self._sub_dispatch, other)
+        if handler is None:
             raise TypeError(f"Cannot subtract {type(other)} from ReactionTerm")
+        return handler(self, other)
 
 
 class Reaction:
     """Reaction"""
 
-    name: str | None = None
+    __slots__ = (
+        "name",
+        "transition_state",
+        "stoichiometry",
+        "_species",
+        "_coefficients",
+        "_reactants",
+        "_products",
+    )
+
+    name: str | None
     """Name Identifier for the Reaction"""
 
-    transition_state: TransitionState | None = None
+    transition_state: TransitionState | None
+
+    stoichiometry: dict[Species, int]
+    """Stoichiometric coefficient of every species, only changed in place
+    by +=
+    """
+
+    _species: tuple[Species, ...]
+    """Species of the stoichiometry in insertion order"""
+
+    _coefficients: np.ndarray
+    """Stoichiometric coefficients parallel to _species"""
+
+    _reactants: tuple[Species, ...] | None
+    """Reactants, filled on first access"""
+
+    _products: tuple[Species, ...] | None
+    """Products, filled on first access"""
+
+    _logger: logging.Logger = _logger
+    """Module logger, no logger is created per Reaction"""
 
     def __init__(
             self,
             name: str | None = None,
             stoichiometry: dict[Species, int] | None = None,
             transition_state: TransitionState | None = None,
+            _pre_filtered: bool = False,
     ):
         """
         Initialize a Reaction with stoichiometry
 
         stoichiometry: Dictionary mapping species to stoichiometric
         coefficients
+        _pre_filtered: The stoichiometry is a fresh dict without 0
+        coefficients, as built by the arithmetic operators
         """
-        self._logger: logging.Logger = logging.getLogger(
-            name or __class__.__name__
-        )
         self.name = name
         self.transition_state = transition_state
-        self.stoichiometry = stoichiometry or {}
-        self.stoichiometry = {
-            k: v for k, v in self.stoichiometry.items() if v != 0
-        } # no need for 0 coefficients
+        if _pre_filtered:
+            self.stoichiometry = stoichiometry
+        else:
+            self.stoichiometry = {
+                k: v for k, v in (stoichiometry or {}).items() if v != 0
+            } # no need for 0 coefficients
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Rebuild the arrays and caches derived from the stoichiometry"""
+        self._species = tuple(self.stoichiometry)
+        self._coefficients = np.fromiter(
+            self.stoichiometry.values(),
+            dtype=np.float64,
+            count=len(self._species),
+        )
+        self._reactants = None
+        self._products = None
+
+    def _merge_inplace(self, terms: Iterable[tuple[Species, int]]) -> None:
+        """Add the coefficients of terms to this Reaction without copying
+        the stoichiometry
+        """
+        _merge_into(self.stoichiometry, terms)
+        self._refresh()
+
+    @classmethod
+    def from_terms(
+            cls,
+            terms: Iterable[ReactionTerm],
+            name: str | None = None,
+            transition_state: TransitionState | None = None,
+    ) -> "Reaction":
+        """Build a Reaction from ReactionTerms in one pass, coefficients of
+        the same species are added up
+        """
+        return cls(
+            name=name,
+            stoichiometry=_merge_into(
+                {}, ((term.species, term.coefficient) for term in terms)
+            ),
+            transition_state=transition_state,
+            _pre_filtered=True,
+        )
 
     def __repr__(self) -> str:
         """Return string representation of the Reaction"""
@@ -242,69 +401,134 @@ class Reaction:
 
     @property
     def species(self) -> list[Species]:
-        return [
-            sp for sp in self.stoichiometry.keys()
-        ]
+        return list(self._species)
 
     @property
     def reactants(self) -> list[Species]:
-        return [
-            sp for sp, coeff in self.stoichiometry.items()
-            if coeff < 0
-        ]
+        if self._reactants is None:
+            self._reactants = tuple(
+                self._species[i]
+                for i in np.flatnonzero(self._coefficients < 0)
+            )
+        return list(self._reactants)
 
     @property
     def products(self) -> list[Species]:
-        return [
-            sp for sp, coeff in self.stoichiometry.items()
-            if coeff > 0
-        ]
+        if self._products is None:
+            self._products = tuple(
+                self._species[i]
+                for i in np.flatnonzero(self._coefficients > 0)
+            )
+        return list(self._products)
 
     def coefficient(self, species: Species) -> float:
         return self.stoichiometry.get(species, 0)
 
-    def __add__(self, other):
-        if isinstance(other, ReactionTerm):
-            result = self.stoichiometry.copy()
-            result[other.species] = result.get(
-                other.species, 0
-            ) + other.coefficient
-            return Reaction(stoichiometry=result)
-
-        elif isinstance(other, Reaction):
-            result = self.stoichiometry.copy()
-            for species, coef in other.stoichiometry.items():
-                result[species] = result.get(species, 0) + coef
-            return Reaction(stoichiometry=result)
-
-        elif isinstance(other, Species):
-            result = self.stoichiometry.copy()
-            result[other] = result.get(other, 0) + 1
-            return Reaction(stoichiometry=result)
+    def _add_term(self, other: ReactionTerm) -> "Reaction":
+        result = _merged(
+            self.stoichiometry, ((other.species, other.coefficient),)
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-        else:
-            raise TypeError(f"Cannot add Reaction to {type(other)}")
+    def _add_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(self.stoichiometry, other.stoichiometry.items())
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-    def __sub__(self, other):
+    def _add_species(self, other: Species) -> "Reaction":
+        result = _merged(self.stoichiometry, ((other, 1),))
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-        if isinstance(other, ReactionTerm):
-            result = self.stoichiometry.copy()
-            result[other.species] = result.get(
-                other.species, 0
-            ) - other.coefficient
-            return Reaction(stoichiometry=result)
+    def _sub_term(self, other: ReactionTerm) -> "Reaction":
+        result = _merged(
+            self.stoichiometry, ((other.species, -other.coefficient),)
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-        elif isinstance(other, Reaction):
-            result = self.stoichiometry.copy()
-            for species, coef in other.stoichiometry.items():
-                result[species] = result.get(species, 0) - coef
-            return Reaction(stoichiometry=result)
+    def _sub_reaction(self, other: "Reaction") -> "Reaction":
+        result = _merged(
+            self.stoichiometry,
+            ((k, -v) for k, v in other.stoichiometry.items()),
+        )
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-        elif isinstance(other, Species):
-            result = self.stoichiometry.copy()
-            result[other] = result.get(other, 0) - 1
-            return Reaction(stoichiometry=result)
+    def _sub_species(self, other: Species) -> "Reaction":
+        result = _merged(self.stoichiometry, ((other, -1),))
+        return Reaction(stoichiometry=result, _pre_filtered=True)
 
-        else:
+    def _iadd_term(self, other: ReactionTerm) -> "Reaction":
+        self._merge_inplace(((other.species, other.coefficient),))
+        return self
+
+    def _iadd_reaction(self, other: "Reaction") -> "Reaction":
+        # Copy the items, other may be self
+        self._merge_inplace(tuple(other.stoichiometry.items()))
+        return self
+
+    def _iadd_species(self, other: Species) -> "Reaction":
+        self._merge_inplace(((other, 1),))
+        return self
+
+    def __add__(self, other):
+        handler = _dispatch(self._add_dispatch, other)
+        if handler is None:
+            raise TypeError(f"Cannot add Reaction to {type(other)}")
+        return handler(self, other)
+
+    def __iadd__(self, other):
+        """Add other to this Reaction in place. Unlike +, no new Reaction
+        is created, so every other reference to this Reaction sees the
+        change.
+
+        Kinetics, Solvation and Reactor derive their species sets, rate
+        models and stoichiometry matrix from the reactions once on
+        construction and key caches by the Reaction object. A Reaction
+        must not be modified with += after it is passed to one of them,
+        += is meant for building reactions.
+        """
+        handler = _dispatch(self._iadd_dispatch, other)
+        if handler is None:
+            raise TypeError(f"Cannot add Reaction to {type(other)}")
+        return handler(self, other)
+
+    def __sub__(self, other):
+        handler = _dispatch(self._sub_dispatch, other)
+        if handler is None:
             raise TypeError(f"Cannot subtract {type(other)} from Reaction")
-        
+        return handler(self, other)
+
+
+# Arithmetic dispatch tables keyed by the type of the right operand, the
+# handlers are registered once all classes exist
+Species._add_dispatch = {
+    Species: Species._add_species,
+    ReactionTerm: Species._add_term,
+    Reaction: Species._add_reaction,
+}
+Species._sub_dispatch = {
+    Species: Species._sub_species,
+    ReactionTerm: Species._sub_term,
+    Reaction: Species._sub_reaction,
+}
+ReactionTerm._add_dispatch = {
+    ReactionTerm: ReactionTerm._add_term,
+    Reaction: ReactionTerm._add_reaction,
+}
+ReactionTerm._sub_dispatch = {
+    ReactionTerm: ReactionTerm._sub_term,
+    Reaction: ReactionTerm._sub_reaction,
+}
+Reaction._add_dispatch = {
+    ReactionTerm: Reaction._add_term,
+    Reaction: Reaction._add_reaction,
+    Species: Reaction._add_species,
+}
+Reaction._iadd_dispatch = {
+    ReactionTerm: Reaction._iadd_term,
+    Reaction: Reaction._iadd_reaction,
+    Species: Reaction._iadd_species,
+}
+Reaction._sub_dispatch = {
+    ReactionTerm: Reaction._sub_term,
+    Reaction: Reaction._sub_reaction,
+    Species: Reaction._sub_species,
+}
@@ -1,6 +1,16 @@
+import os
 from pathlib import Path
 from abc import abstractmethod, ABC
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, kernels run as plain python
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit returning the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
 from ispareto.species import (
     Reaction,
     Species,
@@ -31,6 +41,14 @@ class ReactionInput:
     reactions: list[Reaction]
     """Contains the Reactions present in the System"""
 
+    _species: set[Species]
+    """All species of the reactions, collected once during the input
+    check
+    """
+
+    _transition_states: set[Species]
+    """All transition states of the reactions"""
+
     def __init__(self, reactions: list[Reaction]):
         self.reactions = reactions
         self._check_input()
@@ -53,16 +71,49 @@ class ReactionInput:
                     "Reaction must have one transition state"
                 )
 
+        self._species = {
+            species
+            for reaction in self.reactions
+            for species in reaction.stoichiometry
+        }
+        self._transition_states = {
+            reaction.transition_state for reaction in self.reactions
+        }
+        self._check_files()
+
+    def _check_files(self) -> None:
+        """Checks that the FCHK and TAB files of all species exist, every
+        directory is listed only once and all missing files are reported
+        together
+        """
+        directory_entries: dict[Path, set[str]] = {}
+        missing_files = []
+        for species in self._species | self._transition_states:
+            for file_type, path in (
+                ("FCHK", species.fchk_file_path),
+                ("TAB", species.tab_file_path),
+            ):
+                entries = directory_entries.get(path.parent)
+                if entries is None:
+                    try:
+                        with os.scandir(path.parent) as scan:
+                            entries = {entry.name for entry in scan}
+                    except OSError:
+                        entries = set()
+                    directory_entries[path.parent] = entries
+
+                # The listing only confirms exact names, on case
+                # insensitive file systems the name may differ in case
+                if path.name not in entries and not path.exists():
+                    missing_files.append(f"{file_type} File not found: {path}")
+
+        if missing_files:
+            raise FileNotFoundError("\n".join(sorted(missing_files)))
+
     @property
     def species(self) -> set[Species]:
-        species = set()
-        for reaction in self.reactions:
-            species.update(reaction.species)
-        return species
+        return self._species
 
     @property
     def transition_states(self) -> set[Species]:
-        transition_states = set()
-        for reaction in self.reactions:
-            transition_states.add(reaction.transition_state)
-        return transition_states
\ No newline at end of file
+        return self._transition_states
\ No newline at end of file
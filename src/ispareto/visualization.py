@@ -1,9 +1,9 @@
-import os
-import tempfile
 import numpy as np
 from PIL import Image
 from pathlib import Path
-import matplotlib.pyplot as plt
+from concurrent.futures import Future, ThreadPoolExecutor
+import matplotlib
+from matplotlib.figure import Figure
 
 
 e_factor_bounds: tuple[float, float] = (0, 3.0)
@@ -63,13 +63,41 @@ mathtext.fontset : dejavuserif
 #text.latex.preamble : \usepackage{amsmath} \usepackage{amssymb}
 """
 
-style_file = tempfile.NamedTemporaryFile(
-    mode="w", suffix=".mplstyle", delete=False
+plot_style_params: dict[str, str] = dict(
+    (key.strip(), value.strip())
+    for key, value in (
+        line.split("#", 1)[0].split(":", 1)
+        for line in plot_style.splitlines()
+        if ":" in line.split("#", 1)[0]
+    )
 )
-style_file.write(plot_style)
-style_file.close()
-plt.style.use(style_file.name)
-os.unlink(style_file.name)
+"""Parsed plot style, validated by matplotlib when applied"""
+
+# pyplot is never imported, plots are drawn on plain figures and selecting
+# an interactive backend is not needed
+matplotlib.rcParams.update(plot_style_params)
+
+
+def _pareto_mask(e: np.ndarray, sty: np.ndarray) -> np.ndarray:
+    """Pareto mask for points sorted by decreasing STY and increasing E
+    within equal STY values
+    """
+    if len(e) == 0:
+        return np.zeros(0, dtype=np.bool_)
+    new_group = np.empty(len(e), dtype=np.bool_)
+    new_group[0] = True
+    np.not_equal(sty[1:], sty[:-1], out=new_group[1:])
+    group = np.cumsum(new_group) - 1
+    # Lowest E of every group of equal STY is its first point
+    group_e_min = e[new_group]
+    # Lowest E of all points with a higher STY
+    higher_e_min = np.empty_like(group_e_min)
+    higher_e_min[0] = np.inf
+    np.minimum.accumulate(group_e_min[:-1], out=higher_e_min[1:])
+    return (e == group_e_min[group]) & (
+        (group == 0) | (e < higher_e_min[group])
+    )
+
 
 class Visualization:
     """Visualization of the Development of the Pareto Front with
@@ -82,6 +110,12 @@ class Visualization:
     num_initial_points: int | None = None
     """Initial Points"""
 
+    _executor: ThreadPoolExecutor
+    """Single worker rendering and saving the plots in the background"""
+
+    _pending_plots: list[Future]
+    """Plots submitted to the worker which are not yet collected"""
+
     def __init__(
             self,
             plot_directory: Path,
@@ -90,26 +124,22 @@ class Visualization:
         self.plot_directory = plot_directory
         self.num_initial_points = num_initial_points
 
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_plots = []
+
     def _pareto_front(
             self, e: np.ndarray, sty: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray]:
         """Calculate the Pareto front from arrays of E-factor and STY values.
         """
-        n = len(e)
-        is_pareto = np.ones(n, dtype=bool)
-
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    continue
-                if (sty[j] >= sty[i] and e[j] <= e[i]) and (
-                        sty[j] > sty[i] or e[j] < e[i]):
-                    is_pareto[i] = False
-                    break
-
-        pareto_indices = np.where(is_pareto)[0]
-        sorted_indices = pareto_indices[np.argsort(e[pareto_indices])]
-        return e[sorted_indices], sty[sorted_indices]
+        valid = np.flatnonzero(~(np.isnan(e) | np.isnan(sty)))
+        order = valid[np.lexsort((e[valid], -sty[valid]))]
+        is_pareto = _pareto_mask(e[order], sty[order])
+
+        # E strictly decreases along the front in sweep order, reversing
+        # yields the front sorted by increasing E
+        pareto_indices = order[is_pareto][::-1]
+        return e[pareto_indices], sty[pareto_indices]
 
     def plot(
             self,
@@ -117,59 +147,92 @@ class Visualization:
             sty: np.ndarray,
             iteration: int,
     ) -> None:
+        """Renders and saves the plot of one iteration in the background"""
+        self._pending_plots.append(
+            self._executor.submit(
+                self._render, np.copy(e), np.copy(sty), iteration
+            )
+        )
 
+    def _wait_for_plots(self) -> None:
+        """Blocks until all submitted plots are written, errors of the
+        worker are raised here
+        """
+        pending_plots, self._pending_plots = self._pending_plots, []
+        for pending_plot in pending_plots:
+            pending_plot.result()
+
+    def _render(
+            self,
+            e: np.ndarray,
+            sty: np.ndarray,
+            iteration: int,
+    ) -> None:
+        # Figure is used without pyplot, which is not safe to be used
+        # outside of the main thread
         e_pareto, sty_pareto = self._pareto_front(e, sty)
 
-        plt.figure(figsize=(8, 6))
+        figure = Figure(figsize=(8, 6))
+        ax = figure.add_subplot()
 
         if self.num_initial_points:
-            plt.scatter(
+            ax.scatter(
                 sty[:self.num_initial_points], e[:self.num_initial_points],
                 marker="s", color="black", label="Initial Points",
                 s=64, zorder=4
             )
 
-        plt.scatter(
+        ax.scatter(
             sty[self.num_initial_points:], e[self.num_initial_points:],
             marker="x", color="blue", label="Optimized Points",
             alpha=0.7, zorder=3
         )
 
-        plt.scatter(
+        ax.scatter(
             sty_pareto, e_pareto,
             facecolors="orange", edgecolors="red", s=100, linewidths=1.5,
             label="Pareto Front", zorder=5, marker="o"
         )
 
-        plt.plot(
+        ax.plot(
             sty_pareto, e_pareto,
             color="red", linewidth=2, linestyle="--", zorder=2,
             label="Pareto Curve"
         )
 
-        plt.xlim(*sty_bounds)
-        plt.ylim(*e_factor_bounds)
-        plt.xlabel("STY [kg/m³/h]", fontsize=18)
-        plt.ylabel("E-Factor", fontsize=18)
-        plt.title(
+        ax.set_xlim(*sty_bounds)
+        ax.set_ylim(*e_factor_bounds)
+        ax.set_xlabel("STY [kg/m³/h]", fontsize=18)
+        ax.set_ylabel("E-Factor", fontsize=18)
+        ax.set_title(
             f"In-silicio closed loop multi-objective optimization - "
             f"Iteration {iteration}",
             fontsize=16
         )
-        plt.tick_params(axis="both", which="major", labelsize=15)
-        plt.legend(fontsize=15)
-        plt.grid(True, linestyle="--", alpha=0.5)
-        plt.tight_layout()
+        ax.tick_params(axis="both", which="major", labelsize=15)
+        ax.legend(fontsize=15)
+        ax.grid(True, linestyle="--", alpha=0.5)
+        figure.tight_layout()
 
         file_path = self.plot_directory / f"pareto_front_iteration_{iteration}.png"
-        plt.savefig(str(file_path), dpi=300)
-        plt.close()
+        figure.savefig(str(file_path), dpi=300)
+
+    def close(self) -> None:
+        """Waits for the submitted plots and stops the worker, errors of
+        the worker are raised here. Also called when a run aborts.
+        """
+        try:
+            self._wait_for_plots()
+        finally:
+            self._executor.shutdown()
 
     def animate(self) -> None:
+        self.close()
+
         frame_paths = []
 
         for file in self.plot_directory.iterdir():
-            if ".png" not in file.name:
+            if file.suffix != ".png" or not file.is_file():
                 continue
 
             frame_paths.append(file)
@@ -177,15 +240,20 @@ class Visualization:
         frame_paths.sort(key=lambda x: int(x.stem.split("_")[-1]))
         output_path = self.plot_directory / "pareto_front_animation.gif"
 
-        frames = [
-            Image.open(frame_path)
-            for frame_path in frame_paths
-        ]
-        frames[0].save(
-            output_path,
-            format="GIF",
-            append_images=frames[1:],
-            save_all=True,
-            duration=100,
-            loop=0
-        )
+        def _frames(paths: list[Path]):
+            """Decodes one frame at a time, the GIF writer only keeps the
+            palette converted copy
+            """
+            for frame_path in paths:
+                with Image.open(frame_path) as frame:
+                    yield frame
+
+        with Image.open(frame_paths[0]) as first_frame:
+            first_frame.save(
+                output_path,
+                format="GIF",
+                append_images=_frames(frame_paths[1:]),
+                save_all=True,
+                duration=100,
+                loop=0
+            )
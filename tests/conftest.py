@@ -1,31 +1,103 @@
+import operator
+import pandas as pd
 import pytest
+from dataclasses import dataclass
+from functools import cache, cached_property, reduce
 from pathlib import Path
 
 from ispareto.species import (
+    Reaction,
     Species,
     TransitionState,
 )
 
 
+# Test data layout, shared by the path fixtures and the reference rows
+# which are read at collection time before any fixture exists
+TEST_DATA_PATH = (Path(__file__).parent / "test_data").resolve()
+SYSTEM_1_PATH = TEST_DATA_PATH / "system_1"
+SYSTEM_1_REFERENCE_PATH = SYSTEM_1_PATH / "reference"
+
+# Condition and objective columns read from every reference file, all of
+# them are floats
+REFERENCE_COLUMNS = {
+    "experimental.xlsx": (
+        "tres/min", "2:1", "Conc 1/M", "Temp/°C", "E-factor",
+        "STY/kg m-3 h-1",
+    ),
+    "tsemo_results.csv": (
+        "res_time", "ratio", "conc", "temperature", "E_factor", "STY",
+    ),
+}
+
+@cache
+def _system_1_reference_rows(file_name: str) -> list[dict]:
+    """Rows of a system 1 reference file, read once at collection"""
+    path = SYSTEM_1_REFERENCE_PATH / file_name
+    columns = list(REFERENCE_COLUMNS[file_name])
+    if path.suffix == ".csv":
+        return pd.read_csv(
+            path, usecols=columns, dtype="float64"
+        ).to_dict("records")
+    return pd.read_excel(path, usecols=columns).to_dict("records")
+
+def _sorted_rows(rows: list[dict], *columns: str) -> list[dict]:
+    """Rows ordered by the given condition columns"""
+    return sorted(rows, key=lambda row: tuple(row[c] for c in columns))
+
+def pytest_generate_tests(metafunc):
+    # Every reference row is an independent reactor simulation and its own
+    # test, pytest-xdist can then spread the rows over the workers. Rows are
+    # sorted by their conditions only for a stable order, every row is
+    # simulated from its own initial point.
+    if "experimental_row" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "experimental_row",
+            _sorted_rows(
+                _system_1_reference_rows("experimental.xlsx"),
+                "Temp/°C", "2:1", "Conc 1/M",
+            ),
+        )
+    if "tsemo_results_row" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "tsemo_results_row",
+            _sorted_rows(
+                _system_1_reference_rows("tsemo_results.csv"),
+                "temperature", "ratio", "conc",
+            ),
+        )
+
 @pytest.fixture(scope="session")
 def test_data_path():
-    return Path(__file__).parent / "test_data"
+    return TEST_DATA_PATH
 
-@pytest.fixture
-def test_fchk_path(tmp_path):
-    fchk_path = tmp_path / "test.fchk"
+@pytest.fixture(scope="session")
+def test_fchk_path(tmp_path_factory):
+    fchk_path = tmp_path_factory.mktemp("fchk") / "test.fchk"
     fchk_path.touch()
     return fchk_path
 
-@pytest.fixture
-def test_tab_path(tmp_path):
-    tab_path = tmp_path / "test.tab"
+@pytest.fixture(scope="session")
+def test_tab_path(tmp_path_factory):
+    tab_path = tmp_path_factory.mktemp("tab") / "test.tab"
     tab_path.touch()
     return tab_path
 
 @pytest.fixture(scope="session")
-def test_data_system_1_path(test_data_path):
-    return test_data_path / "system_1"
+def test_other_fchk_path(test_fchk_path):
+    other_fchk_path = test_fchk_path.parent / "other.fchk"
+    other_fchk_path.touch()
+    return other_fchk_path
+
+@pytest.fixture(scope="session")
+def test_other_tab_path(test_tab_path):
+    other_tab_path = test_tab_path.parent / "other.tab"
+    other_tab_path.touch()
+    return other_tab_path
+
+@pytest.fixture(scope="session")
+def test_data_system_1_path():
+    return SYSTEM_1_PATH
 
 @pytest.fixture(scope="session")
 def test_data_system_1_gaussian(test_data_system_1_path):
@@ -44,289 +116,221 @@ def test_data_system_1_gsolv(test_data_system_1_path):
     return test_data_system_1_path / "solvation" / "gsolv.xlsx"
 
 @pytest.fixture(scope="session")
-def test_data_system_1_experimental(test_data_system_1_path):
-    return test_data_system_1_path / "reference" / "experimental.xlsx"
+def test_data_system_1_experimental():
+    return SYSTEM_1_REFERENCE_PATH / "experimental.xlsx"
 
 @pytest.fixture(scope="session")
-def test_data_system_1_tsemo_results(test_data_system_1_path):
-    return test_data_system_1_path / "reference" / "tsemo_results.csv"
-
-@pytest.fixture
-def construct_system_1(test_data_system_1_gaussian, test_data_system_1_cosmo):
-    ##############
-    # Species
-    ##############
-    substrate = Species(
-        name="Substrate",
-        mass=0.159,
-        fchk_file_path=test_data_system_1_gaussian / "Substrate.fchk",
-        tab_file_path=test_data_system_1_cosmo / "Substrate.tab",
-        energy=-635.334856191927,
-    )
+def test_data_system_1_tsemo_results():
+    return SYSTEM_1_REFERENCE_PATH / "tsemo_results.csv"
 
-    nucleophilic = Species(
-        name="Nucleophilic",
-        mass=0.071,
-        fchk_file_path=test_data_system_1_gaussian / "Nucleophilic.fchk",
-        tab_file_path=test_data_system_1_cosmo / "Nucleophilic.tab",
-        energy=-212.567127673868,
-    )
-
-    its_1 = Species(
-        name="ITS1",
-        mass=0.159 + 0.071,
-        fchk_file_path=test_data_system_1_gaussian / "ITS1.fchk",
-        tab_file_path=test_data_system_1_cosmo / "ITS1.tab",
-        energy=-847.894967749602,
-    )
-
-    its_2 = Species(
-        name="ITS2",
-        mass=0.159 + 0.071,
-        fchk_file_path=test_data_system_1_gaussian / "ITS2.fchk",
-        tab_file_path=test_data_system_1_cosmo / "ITS2.tab",
-        energy=-847.87075447606,
-    )
-
-    its_3 = Species(
-        name="ITS3",
-        mass=0.159 + 0.071 + 0.071,
-        fchk_file_path=test_data_system_1_gaussian / "ITS3.fchk",
-        tab_file_path=test_data_system_1_cosmo / "ITS3.tab",
-        energy=-960.014334953842,
-    )
-
-    its_4 = Species(
-        name="ITS4",
-        mass=0.159 + 0.071 + 0.071,
-        fchk_file_path=test_data_system_1_gaussian / "ITS4.fchk",
-        tab_file_path=test_data_system_1_cosmo / "ITS4.tab",
-        energy=-959.989508763147,
-    )
-
-    product_1 = Species(
-        name="Product1",
-        mass=0.21008046,
-        fchk_file_path=test_data_system_1_gaussian / "Product1.fchk",
-        tab_file_path=test_data_system_1_cosmo / "Product1.tab",
-        energy=-747.459040149113,
-    )
-
-    product_2 = Species(
-        name="Product2",
-        mass=0.21008046,
-        fchk_file_path=test_data_system_1_gaussian / "Product2.fchk",
-        tab_file_path=test_data_system_1_cosmo / "Product2.tab",
-        energy=-747.459616153585,
-    )
-
-    product_3 = Species(
-        name="Product3",
-        mass=0.26114773,
-        fchk_file_path=test_data_system_1_gaussian / "Product3.fchk",
-        tab_file_path=test_data_system_1_cosmo / "Product3.tab",
-        energy=-859.579422928392,
-    )
-
-    leaving_group = Species(
-        name="LeavingGroup",
-        mass=0.020,
-        fchk_file_path=test_data_system_1_gaussian / "LeavingGroup.fchk",
-        tab_file_path=test_data_system_1_cosmo / "LeavingGroup.tab",
-        energy=-100.467619260434,
-    )
-
-    ##################
-    # Transition State
-    ##################
-    ts_1_fwd = TransitionState(
-        name="TS1_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS1.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS1.tab",
-        energy=-847.893645136721,
-    )
-
-    ts_1_rev = TransitionState(
-        name="TS1_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS1.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS1.tab",
-        energy=-847.893645136721,
-    )
-
-    ts_2_fwd = TransitionState(
-        name="TS2_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS2.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS2.tab",
-        energy=-847.88361098324,
-    )
-
-    ts_2_rev = TransitionState(
-        name="TS2_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS2.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS2.tab",
-        energy=-847.88361098324,
-    )
-
-    ts_3_fwd = TransitionState(
-        name="TS3_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS3.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS3.tab",
-        energy=-960.013678294337,
-    )
-
-    ts_3_rev = TransitionState(
-        name="TS3_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS3.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS3.tab",
-        energy=-960.013678294337,
-    )
+@pytest.fixture(scope="session")
+def system_1_gsolv_data(test_data_system_1_gsolv):
+    """Gsolv reference sheet, parsed once per session"""
+    return pd.read_excel(test_data_system_1_gsolv)
 
-    ts_4_fwd = TransitionState(
-        name="TS4_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS4.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS4.tab",
-        energy=-960.001694263016,
+@pytest.fixture(scope="session")
+def system_1_kinetics_data(test_data_system_1_kinetics):
+    """Kinetics reference sheet, parsed once per session. Only the
+    temperature and the rate constant column of every transition state
+    are read.
+    """
+    return pd.read_excel(
+        test_data_system_1_kinetics,
+        usecols=["Temperature"]
+        + [spec.name for spec in TRANSITION_STATE_ROWS],
     )
 
-    ts_4_rev = TransitionState(
-        name="TS4_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS4.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS4.tab",
-        energy=-960.001694263016,
-    )
+@dataclass(frozen=True, slots=True)
+class SpeciesSpec:
+    """Input of a system 1 Species, files are named after the species"""
+    name: str
+    """Name of the Species"""
+    mass: float
+    """Mass in kg/mol"""
+    energy: float
+    """Energy in Hartree"""
+
+@dataclass(frozen=True, slots=True)
+class TransitionStateSpec:
+    """Input of a system 1 TransitionState"""
+    name: str
+    """Name of the TransitionState"""
+    file_name: str
+    """Name of the fchk and tab files, shared by fwd and rev"""
+    energy: float
+    """Energy in Hartree"""
+
+# Masses in kg/mol, the intermediates are adducts of the substrate with one
+# or two nucleophiles
+M_SUBSTRATE = 0.159
+M_NUCLEOPHILIC = 0.071
+M_ITS12 = M_SUBSTRATE + M_NUCLEOPHILIC
+M_ITS34 = M_ITS12 + M_NUCLEOPHILIC
+
+SPECIES_ROWS: tuple[SpeciesSpec, ...] = (
+    SpeciesSpec("Substrate", M_SUBSTRATE, -635.334856191927),
+    SpeciesSpec("Nucleophilic", M_NUCLEOPHILIC, -212.567127673868),
+    SpeciesSpec("ITS1", M_ITS12, -847.894967749602),
+    SpeciesSpec("ITS2", M_ITS12, -847.87075447606),
+    SpeciesSpec("ITS3", M_ITS34, -960.014334953842),
+    SpeciesSpec("ITS4", M_ITS34, -959.989508763147),
+    SpeciesSpec("Product1", 0.21008046, -747.459040149113),
+    SpeciesSpec("Product2", 0.21008046, -747.459616153585),
+    SpeciesSpec("Product3", 0.26114773, -859.579422928392),
+    SpeciesSpec("LeavingGroup", 0.020, -100.467619260434),
+)
 
-    ts_1_2_fwd = TransitionState(
-        name="TS12_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS12.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS12.tab",
-        energy=-847.881008554995,
-    )
+TRANSITION_STATE_ROWS: tuple[TransitionStateSpec, ...] = (
+    TransitionStateSpec("TS1_fwd", "TS1", -847.893645136721),
+    TransitionStateSpec("TS1_rev", "TS1", -847.893645136721),
+    TransitionStateSpec("TS2_fwd", "TS2", -847.88361098324),
+    TransitionStateSpec("TS2_rev", "TS2", -847.88361098324),
+    TransitionStateSpec("TS3_fwd", "TS3", -960.013678294337),
+    TransitionStateSpec("TS3_rev", "TS3", -960.013678294337),
+    TransitionStateSpec("TS4_fwd", "TS4", -960.001694263016),
+    TransitionStateSpec("TS4_rev", "TS4", -960.001694263016),
+    TransitionStateSpec("TS12_fwd", "TS12", -847.881008554995),
+    TransitionStateSpec("TS12_rev", "TS12", -847.881008554995),
+    TransitionStateSpec("TS22_fwd", "TS22", -847.862395909096),
+    TransitionStateSpec("TS22_rev", "TS22", -847.862395909096),
+    TransitionStateSpec("TS32_fwd", "TS32", -960.005129677018),
+    TransitionStateSpec("TS32_rev", "TS32", -960.005129677018),
+    TransitionStateSpec("TS42_fwd", "TS42", -959.980523196275),
+    TransitionStateSpec("TS42_rev", "TS42", -959.980523196275),
+)
 
-    ts_1_2_rev = TransitionState(
-        name="TS12_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS12.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS12.tab",
-        energy=-847.881008554995,
-    )
+REACTION_ROWS: tuple[
+    tuple[str, tuple[str, ...], tuple[str, ...], str], ...
+] = (
+    # name, species added, species subtracted, transition state
+    ("R1_fwd", ("ITS1",), ("Substrate", "Nucleophilic"), "TS1_fwd"),
+    ("R1_rev", ("Substrate", "Nucleophilic"), ("ITS1",), "TS1_rev"),
+    ("R2_fwd", ("ITS2",), ("Substrate", "Nucleophilic"), "TS2_fwd"),
+    ("R2_rev", ("Substrate", "Nucleophilic"), ("ITS2",), "TS2_rev"),
+    ("R3_fwd", ("ITS3",), ("Product2", "Nucleophilic"), "TS3_fwd"),
+    ("R3_rev", ("Product2", "Nucleophilic"), ("ITS3",), "TS3_rev"),
+    ("R4_fwd", ("ITS4",), ("Product1", "Nucleophilic"), "TS4_fwd"),
+    ("R4_rev", ("Product1", "Nucleophilic"), ("ITS4",), "TS4_rev"),
+    ("R5_fwd", ("Product1", "LeavingGroup"), ("ITS1",), "TS12_fwd"),
+    ("R5_rev", ("ITS1",), ("Product1", "LeavingGroup"), "TS12_rev"),
+    ("R6_fwd", ("Product2", "LeavingGroup"), ("ITS2",), "TS22_fwd"),
+    ("R6_rev", ("ITS2",), ("Product2", "LeavingGroup"), "TS22_rev"),
+    ("R7_fwd", ("Product3", "LeavingGroup"), ("ITS3",), "TS32_fwd"),
+    ("R7_rev", ("ITS3",), ("Product3", "LeavingGroup"), "TS32_rev"),
+    ("R8_fwd", ("Product3", "LeavingGroup"), ("ITS4",), "TS42_fwd"),
+    ("R8_rev", ("ITS4",), ("Product3", "LeavingGroup"), "TS42_rev"),
+)
 
-    ts_2_2_fwd = TransitionState(
-        name="TS22_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS22.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS22.tab",
-        energy=-847.862395909096,
-    )
+_species_specs = {spec.name: spec for spec in SPECIES_ROWS}
+_transition_state_specs = {spec.name: spec for spec in TRANSITION_STATE_ROWS}
+_reaction_rows = {name: row for name, *row in REACTION_ROWS}
+
+class System1:
+    """Species, transition states and reactions of system 1, every object
+    is constructed on first access
+    """
+
+    def __init__(self, gaussian_dir: Path, cosmo_dir: Path) -> None:
+        self.gaussian_dir = gaussian_dir
+        self.cosmo_dir = cosmo_dir
+        self._paths: dict[tuple[Path, str], Path] = {}
+        self._species: dict[str, Species] = {}
+        self._transition_states: dict[str, TransitionState] = {}
+        self._reactions: dict[str, Reaction] = {}
+
+    def _path(self, directory: Path, file_name: str) -> Path:
+        """Interned data file path. Forward and reverse transition states
+        share one Path object and with it the cached string form hashed
+        by Species.
+        """
+        key = (directory, file_name)
+        if key not in self._paths:
+            self._paths[key] = directory / file_name
+        return self._paths[key]
+
+    def _fchk(self, name: str) -> Path:
+        return self._path(self.gaussian_dir, f"{name}.fchk")
+
+    def _tab(self, name: str) -> Path:
+        return self._path(self.cosmo_dir, f"{name}.tab")
+
+    def species(self, name: str) -> Species:
+        if name not in self._species:
+            spec = _species_specs[name]
+            self._species[name] = Species(
+                name=spec.name,
+                mass=spec.mass,
+                fchk_file_path=self._fchk(spec.name),
+                tab_file_path=self._tab(spec.name),
+                energy=spec.energy,
+            )
+        return self._species[name]
+
+    def transition_state(self, name: str) -> TransitionState:
+        if name not in self._transition_states:
+            spec = _transition_state_specs[name]
+            self._transition_states[name] = TransitionState(
+                name=spec.name,
+                fchk_file_path=self._fchk(spec.file_name),
+                tab_file_path=self._tab(spec.file_name),
+                energy=spec.energy,
+            )
+        return self._transition_states[name]
+
+    def reaction(self, name: str) -> Reaction:
+        if name not in self._reactions:
+            added, subtracted, transition_state = _reaction_rows[name]
+            reaction = reduce(
+                operator.sub,
+                map(self.species, subtracted),
+                reduce(operator.add, map(self.species, added)),
+            )
+            reaction.name = name
+            reaction.transition_state = self.transition_state(
+                transition_state
+            )
+            self._reactions[name] = reaction
+        return self._reactions[name]
+
+    @cached_property
+    def reactions(self) -> list[Reaction]:
+        return [self.reaction(name) for name, *_ in REACTION_ROWS]
 
-    ts_2_2_rev = TransitionState(
-        name="TS22_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS22.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS22.tab",
-        energy=-847.862395909096,
-    )
+@pytest.fixture(scope="session")
+def system_1_reaction_rows():
+    """Name, species added, species subtracted and transition state of
+    every system 1 reaction
+    """
+    return REACTION_ROWS
 
-    ts_3_2_fwd = TransitionState(
-        name="TS32_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS32.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS32.tab",
-        energy=-960.005129677018,
-    )
+@pytest.fixture(scope="session")
+def system_1(test_data_system_1_gaussian, test_data_system_1_cosmo):
+    return System1(test_data_system_1_gaussian, test_data_system_1_cosmo)
 
-    ts_3_2_rev = TransitionState(
-        name="TS32_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS32.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS32.tab",
-        energy=-960.005129677018,
-    )
+@pytest.fixture(scope="session")
+def species_system_1(system_1):
+    """Species and transition states of system 1 by name, no reaction is
+    constructed
+    """
+    species = {spec.name: system_1.species(spec.name) for spec in SPECIES_ROWS}
+    for spec in TRANSITION_STATE_ROWS:
+        species[spec.name] = system_1.transition_state(spec.name)
+    return species
 
-    ts_4_2_fwd = TransitionState(
-        name="TS42_fwd",
-        fchk_file_path=test_data_system_1_gaussian / "TS42.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS42.tab",
-        energy=-959.980523196275,
-    )
+@pytest.fixture(scope="session")
+def system_1_reactants(system_1):
+    """Substrate and nucleophile fed to the system 1 reactor"""
+    return system_1.species("Substrate"), system_1.species("Nucleophilic")
 
-    ts_4_2_rev = TransitionState(
-        name="TS42_rev",
-        fchk_file_path=test_data_system_1_gaussian / "TS42.fchk",
-        tab_file_path=test_data_system_1_cosmo / "TS42.tab",
-        energy=-959.980523196275,
-    )
+@pytest.fixture(scope="session")
+def system_1_product(system_1):
+    """Desired product of system 1"""
+    return system_1.species("Product1")
 
-    ##############
-    # Reactions
-    ##############
-    reaction_1_fwd = its_1 - substrate - nucleophilic
-    reaction_1_fwd.name = "R1_fwd"
-    reaction_1_fwd.transition_state = ts_1_fwd
-
-    reaction_1_rev = substrate + nucleophilic - its_1
-    reaction_1_rev.name = "R1_rev"
-    reaction_1_rev.transition_state = ts_1_rev
-
-    reaction_2_fwd = its_2 - substrate - nucleophilic
-    reaction_2_fwd.name = "R2_fwd"
-    reaction_2_fwd.transition_state = ts_2_fwd
-
-    reaction_2_rev = substrate + nucleophilic - its_2
-    reaction_2_rev.name = "R2_rev"
-    reaction_2_rev.transition_state = ts_2_rev
-
-    reaction_3_fwd = its_3 - product_2 - nucleophilic
-    reaction_3_fwd.name = "R3_fwd"
-    reaction_3_fwd.transition_state = ts_3_fwd
-
-    reaction_3_rev = product_2 + nucleophilic - its_3
-    reaction_3_rev.name = "R3_rev"
-    reaction_3_rev.transition_state = ts_3_rev
-
-    reaction_4_fwd = its_4 - product_1 - nucleophilic
-    reaction_4_fwd.name = "R4_fwd"
-    reaction_4_fwd.transition_state = ts_4_fwd
-
-    reaction_4_rev = product_1 + nucleophilic - its_4
-    reaction_4_rev.name = "R4_rev"
-    reaction_4_rev.transition_state = ts_4_rev
-
-    reaction_5_fwd = product_1 + leaving_group - its_1
-    reaction_5_fwd.name = "R5_fwd"
-    reaction_5_fwd.transition_state = ts_1_2_fwd
-
-    reaction_5_rev = its_1 - product_1 - leaving_group
-    reaction_5_rev.name = "R5_rev"
-    reaction_5_rev.transition_state = ts_1_2_rev
-
-    reaction_6_fwd = product_2 + leaving_group - its_2
-    reaction_6_fwd.name = "R6_fwd"
-    reaction_6_fwd.transition_state = ts_2_2_fwd
-
-    reaction_6_rev = its_2 - product_2 - leaving_group
-    reaction_6_rev.name = "R6_rev"
-    reaction_6_rev.transition_state = ts_2_2_rev
-
-    reaction_7_fwd = product_3 + leaving_group - its_3
-    reaction_7_fwd.name = "R7_fwd"
-    reaction_7_fwd.transition_state = ts_3_2_fwd
-
-    reaction_7_rev = its_3 - product_3 - leaving_group
-    reaction_7_rev.name = "R7_rev"
-    reaction_7_rev.transition_state = ts_3_2_rev
-
-    reaction_8_fwd = product_3 + leaving_group - its_4
-    reaction_8_fwd.name = "R8_fwd"
-    reaction_8_fwd.transition_state = ts_4_2_fwd
-
-    reaction_8_rev = its_4 - product_3 - leaving_group
-    reaction_8_rev.name = "R8_rev"
-    reaction_8_rev.transition_state = ts_4_2_rev
-
-    reactions = [
-        reaction_1_fwd, reaction_1_rev,
-        reaction_2_fwd, reaction_2_rev,
-        reaction_3_fwd, reaction_3_rev,
-        reaction_4_fwd, reaction_4_rev,
-        reaction_5_fwd, reaction_5_rev,
-        reaction_6_fwd, reaction_6_rev,
-        reaction_7_fwd, reaction_7_rev,
-        reaction_8_fwd, reaction_8_rev
-    ]
-
-    return reactions
+@pytest.fixture(scope="session")
+def construct_system_1(system_1):
+    """Reactions of system 1, shared by the whole session. Tests must not
+    modify them, e.g. with +=, a test needing other reactions builds its
+    own.
+    """
+    return system_1.reactions
@@ -1,6 +1,5 @@
 import pytest
 import numpy as np
-import pandas as pd
 
 from ispareto.species import (
     Reactant,
@@ -8,7 +7,7 @@ from ispareto.species import (
     TransitionState,
     Reaction,
 )
-from ispareto.kinetics import Kinetics
+from ispareto.kinetics import Kinetics, _load_molecule
 
 STOICHIOMETRY = {
     'R1_fwd': {'Substrate': -1, 'Nucleophilic': -1, 'ITS1': 1},
@@ -48,27 +47,50 @@ REACTION_TS_MAP = {
     'R8_rev': 'TS42_rev',
 }
 
+SPECIES_NAMES = [
+    'Substrate', 'Nucleophilic', 'Product1', 'Product2',
+    'Product3', 'LeavingGroup', 'ITS1', 'ITS2', 'ITS3', 'ITS4'
+]
+
+
+@pytest.fixture(scope="session")
+def data_file_paths(test_data_system_1_gaussian, test_data_system_1_cosmo):
+    """fchk and tab path of every species and transition state by name,
+    forward and reverse transition states share the paths of their files
+    """
+    paths_by_file = {}
+    paths = {}
+    for name in SPECIES_NAMES + list(REACTION_TS_MAP.values()):
+        file_name = name.split('_')[0]
+        if file_name not in paths_by_file:
+            paths_by_file[file_name] = (
+                test_data_system_1_gaussian / f"{file_name}.fchk",
+                test_data_system_1_cosmo / f"{file_name}.tab",
+            )
+        paths[name] = paths_by_file[file_name]
+    return paths
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation coefficient of two samples"""
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
+    return float(
+        x_centered @ y_centered
+        / (np.linalg.norm(x_centered) * np.linalg.norm(y_centered))
+    )
+
 
 class TestKinetics:
     """Test suite for the Kinetics class"""
 
-    @pytest.fixture
-    def species_dict(
-            self, test_data_system_1_gaussian, test_data_system_1_cosmo
-    ):
+    @pytest.fixture(scope="class")
+    def species_dict(self, data_file_paths):
         """Create dictionary of all species from test data"""
         species = {}
 
-        regular_species = [
-            'Substrate', 'Nucleophilic', 'Product1', 'Product2',
-            'Product3', 'LeavingGroup', 'ITS1', 'ITS2', 'ITS3', 'ITS4'
-        ]
-
-        for name in regular_species:
-            fchk_path = (
-                    test_data_system_1_gaussian / f"{name.split('_')[0]}.fchk"
-            )
-            tab_path = test_data_system_1_cosmo / f"{name}.tab"
+        for name in SPECIES_NAMES:
+            fchk_path, tab_path = data_file_paths[name]
             if name.startswith('ITS'):
                 species[name] = Product(
                     name=name,
@@ -92,11 +114,7 @@ class TestKinetics:
                 )
 
         for ts_name in REACTION_TS_MAP.values():
-            fchk_path = (
-                    test_data_system_1_gaussian /
-                    f"{ts_name.split('_')[0]}.fchk"
-            )
-            tab_path = test_data_system_1_cosmo / f"{ts_name.split('_')[0]}.tab"
+            fchk_path, tab_path = data_file_paths[ts_name]
             species[ts_name] = TransitionState(
                 name=ts_name,
                 fchk_file_path=fchk_path,
@@ -105,7 +123,7 @@ class TestKinetics:
 
         return species
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def reactions(self, species_dict):
         """Create list of reactions from stoichiometry and TS mapping"""
         reactions = []
@@ -127,7 +145,7 @@ class TestKinetics:
 
         return reactions
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def simple_reaction(self, species_dict):
         """Create a simple reaction for basic tests"""
         stoich = {
@@ -141,6 +159,11 @@ class TestKinetics:
             transition_state=species_dict['TS1_fwd']
         )
 
+    @pytest.fixture(scope="class")
+    def simple_kinetics(self, simple_reaction):
+        """Kinetics of the simple reaction without tunneling correction"""
+        return Kinetics(reactions=[simple_reaction])
+
     def test_kinetics_initialization(self, simple_reaction):
         """Test basic initialization of Kinetics object"""
         kinetics = Kinetics(reactions=[simple_reaction])
@@ -169,6 +192,26 @@ class TestKinetics:
         )
         assert kinetics_miller.tunneling_correction == 'miller'
 
+    def test_with_tunneling(self, simple_kinetics):
+        """Test that with_tunneling copies the kinetics and shares the
+        partition functions
+        """
+        kinetics_wigner = simple_kinetics.with_tunneling('wigner')
+
+        assert kinetics_wigner.tunneling_correction == 'wigner'
+        assert simple_kinetics.tunneling_correction is None
+        assert (
+            kinetics_wigner._partition_functions
+            is simple_kinetics._partition_functions
+        )
+        assert (
+            kinetics_wigner._kinetics_models.keys()
+            == simple_kinetics._kinetics_models.keys()
+        )
+
+        with pytest.raises(ValueError, match="Tunneling correction must be"):
+            simple_kinetics.with_tunneling('invalid')
+
     def test_invalid_tunneling_correction(self, simple_reaction):
         """Test that invalid tunneling correction raises error"""
         with pytest.raises(ValueError, match="Tunneling correction must be"):
@@ -228,14 +271,47 @@ class TestKinetics:
         for i in range(len(rate_constants) - 1):
             assert rate_constants[i + 1] > rate_constants[i]
 
+    def test_rate_constant_batch(self, simple_reaction):
+        """Test that batched rate constants match single evaluations"""
+        kinetics = Kinetics(reactions=[simple_reaction])
+
+        temperatures = np.array([298.15, 373.15, 473.15])
+        rate_constants = kinetics.k_batch(simple_reaction, temperatures)
+
+        assert rate_constants.shape == temperatures.shape
+        for temperature, k in zip(temperatures, rate_constants):
+            assert np.isclose(k, kinetics.k(simple_reaction, temperature))
+
+    def test_rate_constant_cached(self, simple_reaction):
+        """Test that repeated rate constant evaluations are cached"""
+        kinetics = Kinetics(reactions=[simple_reaction])
+
+        k = kinetics.k(simple_reaction, 298.15)
+        assert kinetics._k_cache == {(simple_reaction, 298.15): k}
+        assert kinetics.k(simple_reaction, 298.15) == k
+        assert len(kinetics._k_cache) == 1
+
+    def test_rate_constant_cache_bounded(self, simple_reaction):
+        """Test that the rate constant cache keeps only the most recently
+        used temperatures
+        """
+        kinetics = Kinetics(reactions=[simple_reaction])
+        temperatures = np.linspace(290.0, 400.0, 3 * kinetics._k_cache_size)
+
+        for temperature in temperatures:
+            kinetics.k(simple_reaction, temperature)
+
+        assert len(kinetics._k_cache) == kinetics._k_cache_size
+        assert (simple_reaction, temperatures[-1]) in kinetics._k_cache
+        assert (simple_reaction, temperatures[0]) not in kinetics._k_cache
+
     @pytest.mark.parametrize("tunneling", ["wigner", "miller", "eckart"])
-    def test_tunneling_effect_on_rate(self, simple_reaction, tunneling):
+    def test_tunneling_effect_on_rate(
+            self, simple_reaction, simple_kinetics, tunneling
+    ):
         """Test that tunneling corrections increase rate constant"""
-        kinetics_no_tunnel = Kinetics(reactions=[simple_reaction])
-        kinetics_with_tunnel = Kinetics(
-            reactions=[simple_reaction],
-            tunneling_correction=tunneling
-        )
+        kinetics_no_tunnel = simple_kinetics
+        kinetics_with_tunnel = simple_kinetics.with_tunneling(tunneling)
 
         temperature = 298.15
         k_no_tunnel = kinetics_no_tunnel.k(simple_reaction, temperature)
@@ -251,10 +327,19 @@ class TestKinetics:
         assert len(kinetics._kinetics_models) == len(test_reactions)
 
         temperature = 298.15
-        for reaction in test_reactions:
-            k = kinetics.k(reaction, temperature)
-            assert k > 0
-            assert np.isfinite(k)
+        ks = kinetics.k_all(temperature)
+        assert ks.shape == (len(test_reactions),)
+        assert (ks > 0).all()
+        assert np.isfinite(ks).all()
+        assert ks[0] == kinetics.k(test_reactions[0], temperature)
+
+    def test_fchk_parsed_once(self, simple_reaction):
+        """Test fchk files are parsed once for several Kinetics"""
+        Kinetics(reactions=[simple_reaction])
+        hits = _load_molecule.cache_info().hits
+        Kinetics(reactions=[simple_reaction])
+
+        assert _load_molecule.cache_info().hits > hits
 
     def test_gradient_threshold_custom(self, simple_reaction):
         """Test custom gradient threshold"""
@@ -299,11 +384,11 @@ class TestKinetics:
         kinetics = Kinetics(reactions=[simple_reaction])
 
         temperatures = np.linspace(250, 400, 10)
-        rate_constants = [kinetics.k(simple_reaction, T) for T in temperatures]
+        rate_constants = kinetics.k_batch(simple_reaction, temperatures)
 
         ln_k = np.log(rate_constants)
         inv_T = 1.0 / temperatures
-        correlation = np.corrcoef(inv_T, ln_k)[0, 1]
+        correlation = _pearson(inv_T, ln_k)
 
         assert correlation < -0.9
 
@@ -325,22 +410,23 @@ class TestSystem1Kinetics:
     def test_compare_kinetics_with_excel(
             self,
             construct_system_1,
-            test_data_system_1_kinetics,
+            system_1_kinetics_data,
     ):
         """Compares calculated rate constants with values from the
         kinetics.xlsx sheet.
         """
-        kinetics_excel_data = pd.read_excel(test_data_system_1_kinetics)
+        kinetics_excel_data = system_1_kinetics_data
+        temperatures = kinetics_excel_data['Temperature'].to_numpy(float)
+        rows = ~np.isnan(temperatures)
 
         for reaction in construct_system_1:
             ts_name = reaction.transition_state.name
             kinetics_calculator = Kinetics(reactions=[reaction])
 
-            for _, row in kinetics_excel_data.iterrows():
-                temperature = row['Temperature']
-                if np.isnan(temperature):
-                    continue
-                expected_k = row[ts_name]
+            for temperature, expected_k in zip(
+                    temperatures[rows],
+                    kinetics_excel_data[ts_name].to_numpy(float)[rows],
+            ):
                 calculated_k = kinetics_calculator.k(reaction, temperature)
                 assert np.isclose(
                     calculated_k, expected_k, rtol=0.00001
@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 import pandas as pd
-from pathlib import Path
+from functools import lru_cache
 
 from ispareto.kinetics import Kinetics
 from ispareto.reactor import (
@@ -11,318 +11,200 @@ from ispareto.reactor import (
 from ispareto.species import Species
 from ispareto.solvation import Solvation
 
+# Columns read per row: time, ratio, concentration, temperature, E and STY
+EXPERIMENTAL_COLUMNS = [
+    "tres/min", "2:1", "Conc 1/M", "Temp/°C", "E-factor", "STY/kg m-3 h-1",
+]
+TSEMO_RESULTS_COLUMNS = [
+    "res_time", "ratio", "conc", "temperature", "E_factor", "STY",
+]
+# Concentration unit to mmol/L and (rtol, atol) of E and STY per source
+EXPERIMENTAL_COMPARISON = dict(
+    concentration_scale=1000, e_tolerance=(0.15, 0.3),
+    sty_tolerance=(0.10, 1250),
+)
+TSEMO_RESULTS_COMPARISON = dict(
+    concentration_scale=1, e_tolerance=(0.02, 0.05),
+    sty_tolerance=(0.02, 10),
+)
+
+
+def _assert_reference_row(
+        reactor: Reactor,
+        reactants: tuple[Species, Species],
+        product: Species,
+        row: list[float],
+        concentration_scale: float,
+        e_tolerance: tuple[float, float],
+        sty_tolerance: tuple[float, float],
+) -> None:
+    """Simulates the conditions of one reference row and compares E and
+    STY with the reference values
+    """
+    substrate, nucleophilic = reactants
+    (
+        time, ratio, concentration, temperature, expected_E,
+        exptected_STY,
+    ) = row
+    concentration = concentration * concentration_scale
+
+    concentrations = {
+        substrate: concentration,
+        nucleophilic: concentration * ratio,
+    }
+
+    reactor_conditions = ReactorConditions(
+        temperature=temperature,
+        concentrations=concentrations,
+        products=[product, ],
+        time=time,
+    )
+
+    # The reactor is shared by the class, every row starts from its own
+    # initial concentrations so its result does not depend on the order
+    # or selection of the rows
+    reactor.reset_initial_point()
+    E, STY = reactor.simulate(reactor_conditions)
+
+    rtol, atol = e_tolerance
+    assert np.isclose(
+        E, expected_E, rtol=rtol, atol=atol
+    ), (
+        f"(Conditions: '{row}') "
+        f"at {temperature}K: Calculated={E:.4e}, "
+        f"Excel={expected_E:.4e}"
+    )
+
+    rtol, atol = sty_tolerance
+    assert np.isclose(
+        STY, exptected_STY, rtol=rtol, atol=atol
+    ), (
+        f"(Conditions: '{row}') "
+        f"at {temperature}K: Calculated={STY:.4e}, "
+        f"Excel={exptected_STY:.4e}"
+    )
+
+
 class PatchedKinetics(Kinetics):
 
-    def __init__(self, reactions: list, excel_path: Path):
+    def __init__(self, reactions: list, kinetics: pd.DataFrame):
         super().__init__(reactions)
-        self.kinetics = self._load_kinetics(excel_path)
-
-    @staticmethod
-    def _load_kinetics(excel_path: Path) -> pd.DataFrame:
-        kinetics = pd.read_excel(excel_path)
-        return kinetics
+        self.kinetics = kinetics
+        # Columns as arrays once, k is called for every reaction per solve
+        self._temperatures = self.kinetics["Temperature"].to_numpy(float)
+        self._names = [
+            name for name in self.kinetics.columns if name != "Temperature"
+        ]
+        self._rate_constants = self.kinetics[self._names].to_numpy(float)
+        self._rates_at = lru_cache(maxsize=256)(self._interpolate_rates)
+
+    def _interpolate_rates(self, temperature: float) -> dict[str, float]:
+        # The reactor asks for every reaction at the same temperature, all
+        # columns are interpolated on the first request
+        return {
+            name: float(np.interp(
+                temperature, self._temperatures, rate_constants
+            ))
+            for name, rate_constants in zip(
+                self._names, self._rate_constants.T
+            )
+        }
 
     def k(self, reaction, temperature) -> float:
-        transition_state = reaction.transition_state
-        name = transition_state.name
-        return float(np.interp(
-            temperature,
-            self.kinetics["Temperature"].values.tolist(),
-            self.kinetics[name].values.tolist(),
-        ))
+        rates = self._rates_at(temperature)
+        return rates[reaction.transition_state.name]
 
 
 class TestSystem1PatchedReactor:
 
-    @pytest.fixture
-    def setup_kinetics(self, construct_system_1, test_data_system_1_kinetics):
-        excel_path = test_data_system_1_kinetics.parent / "kinetics.xlsx"
+    @pytest.fixture(scope="class")
+    def setup_kinetics(self, construct_system_1, system_1_kinetics_data):
         kinetics = PatchedKinetics(
             construct_system_1,
-            excel_path,
+            system_1_kinetics_data,
         )
         return kinetics
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def setup_solvation(self, construct_system_1):
         solvation = Solvation(construct_system_1)
         return solvation
 
-    @pytest.fixture
-    def setup_reactants(
-            self,
-            test_data_system_1_gaussian,
-            test_data_system_1_cosmo,
-    ):
-        substrate = Species(
-            name="Substrate",
-            mass=0.159,
-            fchk_file_path=test_data_system_1_gaussian / "Substrate.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Substrate.tab",
-            energy=-635.334856191927,
-        )
-
-        nucleophilic = Species(
-            name="Nucleophilic",
-            mass=0.071,
-            fchk_file_path=test_data_system_1_gaussian / "Nucleophilic.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Nucleophilic.tab",
-            energy=-212.567127673868,
-        )
-        return substrate, nucleophilic
-
-    @pytest.fixture
-    def setup_product(
-            self,
-            test_data_system_1_gaussian,
-            test_data_system_1_cosmo,
-    ):
-        product_1 = Species(
-            name="Product1",
-            mass=0.21008046,
-            fchk_file_path=test_data_system_1_gaussian / "Product1.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Product1.tab",
-            energy=-747.459040149113,
+    @pytest.fixture(scope="class")
+    def reactor(self, construct_system_1, setup_kinetics, setup_solvation):
+        return Reactor(
+            reactions=construct_system_1,
+            kinetics=setup_kinetics,
+            solvation=setup_solvation,
         )
-        return product_1
 
     @pytest.mark.slow
     def test_reactor(
             self,
-            construct_system_1,
-            setup_kinetics,
-            setup_solvation,
-            setup_reactants,
-            setup_product,
-            test_data_system_1_experimental,
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            experimental_row,
     ):
-        experimental_excel_data = pd.read_excel(
-            test_data_system_1_experimental
+        _assert_reference_row(
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            [experimental_row[column] for column in EXPERIMENTAL_COLUMNS],
+            **EXPERIMENTAL_COMPARISON,
         )
 
-        reactor = Reactor(
-            reactions=construct_system_1,
-            kinetics=setup_kinetics,
-            solvation=setup_solvation,
-        )
-
-        substrate, nucleophilic = setup_reactants
-
-        for _, row in experimental_excel_data.iterrows():
-            time = row["tres/min"]
-            ratio = row["2:1"]
-            concentration = row["Conc 1/M"] * 1000
-            temperature = row["Temp/°C"]
-            expected_E = row["E-factor"]
-            exptected_STY = row["STY/kg m-3 h-1"]
-
-            concentrations = {
-                substrate: concentration,
-                nucleophilic: concentration * ratio,
-            }
-
-            reactor_conditions = ReactorConditions(
-                temperature=temperature,
-                concentrations=concentrations,
-                products=[setup_product, ],
-                time=time,
-            )
-
-            E, STY = reactor.simulate(reactor_conditions)
-
-            assert np.isclose(
-                E, expected_E, rtol=0.15, atol=0.3
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={E:.4e}, "
-                f"Excel={expected_E:.4e}"
-            )
-            print("=" * 20)
-            print("STY:", STY)
-            print("Excel STY:", exptected_STY)
-            print("E:", E)
-            print("Excel E:", expected_E)
-            print("=" * 20)
-
-            assert np.isclose(
-                STY, exptected_STY, rtol=0.10, atol=1250
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={STY:.4e}, "
-                f"Excel={exptected_STY:.4e}"
-            )
-
 
 class TestSystem1Reactor:
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def setup_kinetics(self, construct_system_1):
         kinetics = Kinetics(
             construct_system_1
         )
         return kinetics
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def setup_solvation(self, construct_system_1):
         solvation = Solvation(construct_system_1)
         return solvation
 
-    @pytest.fixture
-    def setup_reactants(
-            self,
-            test_data_system_1_gaussian,
-            test_data_system_1_cosmo,
-    ):
-        substrate = Species(
-            name="Substrate",
-            mass=0.159,
-            fchk_file_path=test_data_system_1_gaussian / "Substrate.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Substrate.tab",
-            energy=-635.334856191927,
-        )
-
-        nucleophilic = Species(
-            name="Nucleophilic",
-            mass=0.071,
-            fchk_file_path=test_data_system_1_gaussian / "Nucleophilic.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Nucleophilic.tab",
-            energy=-212.567127673868,
-        )
-        return substrate, nucleophilic
-
-    @pytest.fixture
-    def setup_product(
-            self,
-            test_data_system_1_gaussian,
-            test_data_system_1_cosmo,
-    ):
-        product_1 = Species(
-            name="Product1",
-            mass=0.21008046,
-            fchk_file_path=test_data_system_1_gaussian / "Product1.fchk",
-            tab_file_path=test_data_system_1_cosmo / "Product1.tab",
-            energy=-747.459040149113,
+    @pytest.fixture(scope="class")
+    def reactor(self, construct_system_1, setup_kinetics, setup_solvation):
+        return Reactor(
+            reactions=construct_system_1,
+            kinetics=setup_kinetics,
+            solvation=setup_solvation,
         )
-        return product_1
 
     @pytest.mark.slow
     def test_reactor_experimental(
             self,
-            construct_system_1,
-            setup_kinetics,
-            setup_solvation,
-            setup_reactants,
-            setup_product,
-            test_data_system_1_experimental,
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            experimental_row,
     ):
-        experimental_excel_data = pd.read_excel(test_data_system_1_experimental)
-
-        reactor = Reactor(
-            reactions=construct_system_1,
-            kinetics=setup_kinetics,
-            solvation=setup_solvation,
+        _assert_reference_row(
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            [experimental_row[column] for column in EXPERIMENTAL_COLUMNS],
+            **EXPERIMENTAL_COMPARISON,
         )
 
-        substrate, nucleophilic = setup_reactants
-
-        for _, row in experimental_excel_data.iterrows():
-            time = row["tres/min"]
-            ratio = row["2:1"]
-            concentration = row["Conc 1/M"] * 1000
-            temperature = row["Temp/°C"]
-            expected_E = row["E-factor"]
-            exptected_STY = row["STY/kg m-3 h-1"]
-
-            concentrations = {
-                substrate: concentration,
-                nucleophilic: concentration * ratio,
-            }
-
-            reactor_conditions = ReactorConditions(
-                temperature=temperature,
-                concentrations=concentrations,
-                products=[setup_product,],
-                time=time,
-            )
-
-            E, STY = reactor.simulate(reactor_conditions)
-
-            assert np.isclose(
-                E, expected_E, rtol=0.15, atol=0.3
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={E:.4e}, "
-                f"Excel={expected_E:.4e}"
-            )
-
-            assert np.isclose(
-                STY, exptected_STY, rtol=0.10, atol=1250
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={STY:.4e}, "
-                f"Excel={exptected_STY:.4e}"
-            )
-
     @pytest.mark.slow
     def test_reactor_tsemo_results(
             self,
-            construct_system_1,
-            setup_kinetics,
-            setup_solvation,
-            setup_reactants,
-            setup_product,
-            test_data_system_1_tsemo_results,
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            tsemo_results_row,
     ):
-
-        tsemo_results_data = pd.read_csv(
-            test_data_system_1_tsemo_results
-        )
-
-        reactor = Reactor(
-            reactions=construct_system_1,
-            kinetics=setup_kinetics,
-            solvation=setup_solvation,
+        _assert_reference_row(
+            reactor,
+            system_1_reactants,
+            system_1_product,
+            [tsemo_results_row[column] for column in TSEMO_RESULTS_COLUMNS],
+            **TSEMO_RESULTS_COMPARISON,
         )
-
-        substrate, nucleophilic = setup_reactants
-
-        for _, row in tsemo_results_data.iterrows():
-            time = row["res_time"]
-            ratio = row["ratio"]
-            concentration = row["conc"]
-            temperature = row["temperature"]
-            expected_E = row["E_factor"]
-            exptected_STY = row["STY"]
-
-            concentrations = {
-                substrate: concentration,
-                nucleophilic: concentration * ratio,
-            }
-
-            reactor_conditions = ReactorConditions(
-                temperature=temperature,
-                concentrations=concentrations,
-                products=[setup_product,],
-                time=time,
-            )
-
-            E, STY = reactor.simulate(reactor_conditions)
-
-            assert np.isclose(
-                E, expected_E, rtol=0.02, atol=0.05
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={E:.4e}, "
-                f"Excel={expected_E:.4e}"
-            )
-
-            assert np.isclose(
-                STY, exptected_STY, rtol=0.02, atol=10
-            ), (
-                f"(Conditions: '{row}') "
-                f"at {temperature}K: Calculated={STY:.4e}, "
-                f"Excel={exptected_STY:.4e}"
-            )
-
-
-
@@ -1,15 +1,18 @@
 import pytest
 import numpy as np
-import pandas as pd
 
-from ispareto.solvation import Solvation
+from ispareto.solvation import Solvation, _read_cosmo_therm_file
+
+
+@pytest.fixture(scope="module")
+def solvation_instance(construct_system_1):
+    """Solvation instance with all system 1 reactions, shared by the module
+    as no test modifies it.
+    """
+    return Solvation(reactions=construct_system_1)
 
 
 class TestSolvation:
-    @pytest.fixture
-    def solvation_instance(self, construct_system_1):
-        """Fixture to create a Solvation instance with system 1 reactions."""
-        return Solvation(reactions=construct_system_1)
 
     def test_solvation_initialization(self, solvation_instance, construct_system_1):
         """Test if Solvation class initializes and extracts G values."""
@@ -30,10 +33,10 @@ class TestSolvation:
             assert len(solvation_instance._g_values[species]) > 0
 
     def test_parse_cosmo_therm_file(
-            self, construct_system_1, solvation_instance
+            self, species_system_1, solvation_instance
     ):
         """Test the _parse_cosmo_therm_file static method."""
-        test_species = construct_system_1[0].reactants[0]
+        test_species = species_system_1["Substrate"]
 
         g_values = solvation_instance._parse_cosmo_therm_file(test_species)
         assert isinstance(g_values, dict)
@@ -43,10 +46,17 @@ class TestSolvation:
         if g_values:
              assert len(g_values) > 0
 
+    def test_tab_parsed_once(self, construct_system_1, solvation_instance):
+        """Test tab files are parsed once for several Solvation"""
+        hits = _read_cosmo_therm_file.cache_info().hits
+        solvation = Solvation(reactions=construct_system_1)
+
+        assert _read_cosmo_therm_file.cache_info().hits > hits
+        assert solvation._g_values == solvation_instance._g_values
 
-    def test_g_method_interpolation(self, solvation_instance, construct_system_1):
+    def test_g_method_interpolation(self, solvation_instance, species_system_1):
         """Test the _g method for a species and temperature, including interpolation."""
-        test_species = construct_system_1[0].reactants[0]
+        test_species = species_system_1["Substrate"]
 
         known_temp = list(solvation_instance._g_values[test_species].keys())[0]
         expected_g = solvation_instance._g_values[test_species][known_temp]
@@ -64,6 +74,20 @@ class TestSolvation:
             solvation_instance._g(test_species, interp_temp), expected_interp_g
         )
 
+    def test_g_batch(self, solvation_instance, species_system_1):
+        """Test _g_batch matches _g at every temperature"""
+        test_species = species_system_1["Substrate"]
+        temps = sorted(solvation_instance._g_values[test_species].keys())
+        temperatures = np.linspace(temps[0] - 10.0, temps[-1] + 10.0, 25)
+
+        expected_g = [
+            solvation_instance._g(test_species, t) for t in temperatures
+        ]
+        assert np.allclose(
+            solvation_instance._g_batch(test_species, temperatures),
+            expected_g,
+        )
+
 
     def test_correction_factor(self, solvation_instance, construct_system_1):
         """Test the correction_factor method for a reaction."""
@@ -85,6 +109,43 @@ class TestSolvation:
         calculated_factor = solvation_instance.correction_factor(test_reaction, temperature)
         assert np.isclose(calculated_factor, expected_factor)
 
+    def test_correction_factor_batch(
+            self, solvation_instance, construct_system_1
+    ):
+        """Test correction_factor_batch matches correction_factor"""
+        temperatures = np.array([280.0, 298.15, 320.0, 350.0])
+        for reaction in construct_system_1:
+            expected_factors = [
+                solvation_instance.correction_factor(reaction, t)
+                for t in temperatures
+            ]
+            assert np.allclose(
+                solvation_instance.correction_factor_batch(
+                    reaction, temperatures
+                ),
+                expected_factors,
+            )
+
+    def test_correction_factor_matrix(
+            self, solvation_instance, construct_system_1
+    ):
+        """Test every row of correction_factor_matrix matches
+        correction_factor_batch
+        """
+        temperatures = np.array([280.0, 298.15, 320.0, 350.0])
+        factors = solvation_instance.correction_factor_matrix(
+            construct_system_1, temperatures
+        )
+
+        assert factors.shape == (len(construct_system_1), len(temperatures))
+        for row, reaction in zip(factors, construct_system_1):
+            assert np.allclose(
+                row,
+                solvation_instance.correction_factor_batch(
+                    reaction, temperatures
+                ),
+            )
+
     def test_correction_factor_multiple_reactants(self, construct_system_1, test_data_system_1_cosmo):
         """Test correction_factor with a reaction having multiple reactants."""
         reaction_1_fwd = construct_system_1[0]
@@ -114,115 +175,115 @@ class TestSystem1Solvation:
     def test_compare_gsolv(
             self,
             construct_system_1,
-            test_data_system_1_gsolv,
+            solvation_instance,
+            system_1_gsolv_data,
     ):
-        gsolv_excel_data = pd.read_excel(test_data_system_1_gsolv)
+        gsolv_excel_data = system_1_gsolv_data
+        temperatures = gsolv_excel_data['Temperature (K)'].to_numpy(float)
 
+        solvation = solvation_instance
         for reaction in construct_system_1:
-            solvation = Solvation([reaction])
             reactants = reaction.reactants
             transition_state = reaction.transition_state
             species = reactants + [transition_state]
 
-            for _, row in gsolv_excel_data.iterrows():
-                temperature = row['Temperature (K)']
-
-                for reactant in species:
-                    calculated_g = solvation._g(reactant, temperature)
-                    expected_g = row[reactant.name]
-                    assert np.isclose(
-                        calculated_g,
-                        expected_g,
-                        rtol=0.01, atol=1e-9
-                    ), (
-                        f"Gsolv mismatch for species '{reactant.name}' "
-                        f"(Species: '{reactant}') "
-                        f"at {temperature}K: "
-                        f"Calculated={calculated_g:.4e}, "
-                        f"Excel={expected_g:.4e}"
-                    )
+            for reactant in species:
+                expected_g = gsolv_excel_data[reactant.name].to_numpy(float)
+                err_msg = (
+                    f"Gsolv mismatch for species '{reactant.name}' "
+                    f"(Species: '{reactant}')"
+                )
+                np.testing.assert_allclose(
+                    solvation._g_batch(reactant, temperatures),
+                    expected_g,
+                    rtol=0.01, atol=1e-9,
+                    err_msg=err_msg,
+                )
+                # The reactor evaluates the scalar _g
+                np.testing.assert_allclose(
+                    [solvation._g(reactant, t) for t in temperatures],
+                    expected_g,
+                    rtol=0.01, atol=1e-9,
+                    err_msg=err_msg,
+                )
 
     def test_compare_correction_factor(
             self,
             construct_system_1,
-            test_data_system_1_gsolv,
+            solvation_instance,
+            system_1_gsolv_data,
     ):
         """Compares calculated correction factors with values from the
         gsolv.xlsx sheet.
         """
-        gsolv_excel_data = pd.read_excel(test_data_system_1_gsolv)
+        gsolv_excel_data = system_1_gsolv_data
+        temperatures = gsolv_excel_data['Temperature (K)'].to_numpy(float)
 
+        solvation = solvation_instance
         for reaction in construct_system_1:
-            solvation = Solvation([reaction])
             reactants = reaction.reactants
             transition_state = reaction.transition_state
 
-            for _, row in gsolv_excel_data.iterrows():
-                temperature = row['Temperature (K)']
-
-                expected_reactants_gsolv = sum([
-                    row[reactant.name] for reactant in reactants
-                ])
-                calculated_reactans_gsolv = sum([
-                    solvation._g(reactant, temperature)
-                    for reactant in reactants
-                ])
-                assert np.isclose(
-                    calculated_reactans_gsolv, expected_reactants_gsolv,
-                    rtol=0.01, atol=1e-9
-                ), (
+            expected_reactants_gsolv = sum(
+                gsolv_excel_data[reactant.name].to_numpy(float)
+                for reactant in reactants
+            )
+            calculated_reactans_gsolv = sum(
+                solvation._g_batch(reactant, temperatures)
+                for reactant in reactants
+            )
+            np.testing.assert_allclose(
+                calculated_reactans_gsolv, expected_reactants_gsolv,
+                rtol=0.01, atol=1e-9,
+                err_msg=(
                     f"Gibbs mismatch for reaction '{reaction.name}' "
-                    f"(Species: '{reaction}') "
-                    f"at {temperature}K: "
-                    f"Calculated={calculated_reactans_gsolv:.4e}, "
-                    f"Excel={expected_reactants_gsolv:.4e}"
-                )
-
-                expected_transition_state_gsolv = row[transition_state.name]
-                calculated_transition_state_gsolv = solvation._g(
-                    transition_state, temperature
-                )
-
-                assert np.isclose(
-                    calculated_transition_state_gsolv,
-                    expected_transition_state_gsolv,
-                    rtol=0.01, atol=1e-9
-                ), (
+                    f"(Species: '{reaction}')"
+                ),
+            )
+
+            expected_transition_state_gsolv = (
+                gsolv_excel_data[transition_state.name].to_numpy(float)
+            )
+            calculated_transition_state_gsolv = solvation._g_batch(
+                transition_state, temperatures
+            )
+            np.testing.assert_allclose(
+                calculated_transition_state_gsolv,
+                expected_transition_state_gsolv,
+                rtol=0.01, atol=1e-9,
+                err_msg=(
                     f"Gibbs mismatch for reaction '{reaction.name}' "
-                    f"(Species: '{reaction}') "
-                    f"at {temperature}K: "
-                    f"Calculated={calculated_transition_state_gsolv:.4e}, "
-                    f"Excel={expected_transition_state_gsolv:.4e}"
-                )
-
-
-                expected_delta_g = (
-                        expected_transition_state_gsolv -
-                        expected_reactants_gsolv
-                )
-                expected_delta_g_si_units = expected_delta_g * 4184
-                expected_correction_factor = np.exp(
-                    - expected_delta_g_si_units / (8.3145 * temperature)
-                )
-
-                calculated_correction_factor = solvation.correction_factor(
-                    reaction, temperature
-                )
-
-                assert np.isclose(
-                    calculated_correction_factor, expected_correction_factor,
-                    rtol=0.01, atol=1e-9
-                ), (
-                    f"Correction Factor mismatch for reaction "
-                    f"'{reaction.name}' "
-                    f"(Reaction: '{reaction}') "
-                    f"at {temperature}K: "
-                    f"Calculated={calculated_correction_factor:.4e}, "
-                    f"Excel={expected_correction_factor:.4e}"
-                )
-
-
-
-
-
-
+                    f"(Species: '{reaction}')"
+                ),
+            )
+
+            expected_delta_g = (
+                    expected_transition_state_gsolv -
+                    expected_reactants_gsolv
+            )
+            expected_delta_g_si_units = expected_delta_g * 4184
+            expected_correction_factor = np.exp(
+                - expected_delta_g_si_units / (8.3145 * temperatures)
+            )
+
+            err_msg = (
+                f"Correction Factor mismatch for reaction "
+                f"'{reaction.name}' "
+                f"(Reaction: '{reaction}')"
+            )
+            np.testing.assert_allclose(
+                solvation.correction_factor_batch(reaction, temperatures),
+                expected_correction_factor,
+                rtol=0.01, atol=1e-9,
+                err_msg=err_msg,
+            )
+            # The reactor evaluates the scalar correction_factor
+            np.testing.assert_allclose(
+                [
+                    solvation.correction_factor(reaction, t)
+                    for t in temperatures
+                ],
+                expected_correction_factor,
+                rtol=0.01, atol=1e-9,
+                err_msg=err_msg,
+            )
@@ -1,5 +1,6 @@
+import logging
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock
 
 from ispareto.species import (
     Species,
@@ -10,6 +11,53 @@ from ispareto.species import (
     ReactionTerm,
 )
 
+SYSTEM_SPECIES_NAMES = [
+    'Substrate', 'Nucleophilic', 'ITS1', 'ITS2', 'ITS3', 'ITS4',
+    'Product1', 'Product2', 'Product3', 'LeavingGroup'
+]
+
+# Stoichiometry of the complex system reconstructed from ReactionTerms
+TARGET_STOICH = {
+    'R1_fwd': {'Substrate': -1, 'Nucleophilic': -1, 'ITS1': 1},
+    'R1_rev': {'ITS1': -1, 'Substrate': 1, 'Nucleophilic': 1},
+    'R2_fwd': {'Substrate': -1, 'Nucleophilic': -1, 'ITS2': 1},
+    'R2_rev': {'ITS2': -1, 'Substrate': 1, 'Nucleophilic': 1},
+    'R3_fwd': {'Product2': -1, 'Nucleophilic': -1, 'ITS3': 1},
+    'R3_rev': {'ITS3': -1, 'Product2': 1, 'Nucleophilic': 1},
+    'R4_fwd': {'Product1': -1, 'Nucleophilic': -1, 'ITS4': 1},
+    'R4_rev': {'ITS4': -1, 'Product1': 1, 'Nucleophilic': 1},
+    'R5_fwd': {'ITS1': -1, 'Product1': 1, 'LeavingGroup': 1},
+    'R5_rev': {'Product1': -1, 'LeavingGroup': -1, 'ITS1': 1},
+    'R6_fwd': {'ITS2': -1, 'Product2': 1, 'LeavingGroup': 1},
+    'R6_rev': {'Product2': -1, 'LeavingGroup': -1, 'ITS2': 1},
+    'R7_fwd': {'ITS3': -1, 'Product3': 1, 'LeavingGroup': 1},
+    'R7_rev': {'Product3': -1, 'LeavingGroup': -1, 'ITS3': 1},
+    'R8_fwd': {'ITS4': -1, 'Product3': 1, 'LeavingGroup': 1},
+    'R8_rev': {'Product3': -1, 'LeavingGroup': -1, 'ITS1': 1},
+}
+
+
+@pytest.fixture(scope="module")
+def demo_species(test_fchk_path, test_tab_path):
+    """Species shared by the ReactionTerm and Reaction tests, which only
+    read them
+    """
+    return {
+        "H2O": Species("H2O", 18.015, test_fchk_path, test_tab_path),
+        "CO2": Species("CO2", 44.01, test_fchk_path, test_tab_path),
+        "CH4": Species("CH4", 16.04, test_fchk_path, test_tab_path),
+        "O2": Species("O2", 32.0, test_fchk_path, test_tab_path),
+    }
+
+
+@pytest.fixture(scope="module")
+def system_species(test_fchk_path, test_tab_path):
+    """Species of the complex stoichiometry system by name"""
+    return {
+        name: Species(name, 100.0, test_fchk_path, test_tab_path)
+        for name in SYSTEM_SPECIES_NAMES
+    }
+
 
 class TestSpecies:
     """Tests for Species and its subclasses"""
@@ -29,10 +77,15 @@ class TestSpecies:
         assert species.tab_file_path == test_tab_path
 
     def test_species_logger_creation(self, test_fchk_path, test_tab_path):
-        """Test that logger is created with correct name"""
-        with patch('logging.getLogger') as mock_logger:
-            _ = Species("CO2", 44.01, test_fchk_path, test_tab_path)
-            mock_logger.assert_called_with("Species('CO2')")
+        """Test that no logger is created per species"""
+        get_logger = logging.getLogger
+        logging.getLogger = mock_logger = Mock()
+        try:
+            species = Species("CO2", 44.01, test_fchk_path, test_tab_path)
+        finally:
+            logging.getLogger = get_logger
+        mock_logger.assert_not_called()
+        assert species._logger is logging.getLogger("ispareto.species")
 
     def test_reactant_inheritance(self, test_fchk_path, test_tab_path):
         """Test Reactant class inherits from Species"""
@@ -58,22 +111,52 @@ class TestSpecies:
         assert ts.name == "TS1"
         assert ts.mass is None
 
-    def test_species_equality_and_hash(self, test_fchk_path, test_tab_path):
+    def test_species_equality_and_hash(
+            self, test_fchk_path, test_tab_path, test_other_fchk_path,
+            test_other_tab_path,
+    ):
         """Test Species equality and hash for use as dict keys"""
         species1 = Species("H2O", 18.015, test_fchk_path, test_tab_path)
         species2 = Species("H2O", 18.015, test_fchk_path, test_tab_path)
-        other_fchk_path = test_fchk_path.parent / "other.fchk"
-        other_tab_path = test_tab_path.parent / "other.tab"
-        other_fchk_path.touch(exist_ok=True)
-        other_tab_path.touch(exist_ok=True)
-
-        species3 = Species("CO2", 44.01, other_fchk_path, other_tab_path)
+        species3 = Species(
+            "CO2", 44.01, test_other_fchk_path, test_other_tab_path
+        )
 
         assert species1 == species2
         assert species1 != species3
         assert hash(species1) == hash(species2)
         assert hash(species1) != hash(species3)
 
+    def test_species_get_or_create(
+            self, test_fchk_path, test_tab_path, test_other_tab_path
+    ):
+        """Test get_or_create returns one canonical instance"""
+        species1 = Species.get_or_create(
+            name="H2O", mass=18.015,
+            fchk_file_path=test_fchk_path, tab_file_path=test_tab_path,
+        )
+        species2 = Species.get_or_create(
+            name="H2O", mass=18.015,
+            fchk_file_path=test_fchk_path, tab_file_path=test_tab_path,
+        )
+        ts = TransitionState.get_or_create(
+            name="H2O", fchk_file_path=test_fchk_path,
+            tab_file_path=test_tab_path,
+        )
+
+        species3 = Species.get_or_create(
+            "H2O", 18.015, str(test_fchk_path), test_other_tab_path,
+            energy=None,
+        )
+
+        assert species1 is species2
+        assert species3 is species1
+        assert ts is not species1
+        assert isinstance(ts, TransitionState)
+        assert species1 is not Species(
+            "H2O", 18.015, test_fchk_path, test_tab_path
+        )
+
     def test_species_addition(self, test_fchk_path, test_tab_path):
         """Test Species + Species creates a Reaction"""
         species1 = Species("H2O", 18.015, test_fchk_path, test_tab_path)
@@ -111,11 +194,11 @@ class TestReactionTerm:
     """Tests for ReactionTerm class"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self, test_fchk_path, test_tab_path):
+    def setup_method(self, demo_species):
         """Set up test species"""
-        self.h2o = Species("H2O", 18.015, test_fchk_path, test_tab_path)
-        self.co2 = Species("CO2", 44.01, test_fchk_path, test_tab_path)
-        self.ch4 = Species("CH4", 16.04, test_fchk_path, test_tab_path)
+        self.h2o = demo_species["H2O"]
+        self.co2 = demo_species["CO2"]
+        self.ch4 = demo_species["CH4"]
 
     def test_reaction_term_initialization(self):
         """Test ReactionTerm initialization"""
@@ -159,6 +242,23 @@ class TestReactionTerm:
         assert new_reaction.stoichiometry[self.co2] == 1
         assert new_reaction.stoichiometry[self.ch4] == -1
 
+    def test_reaction_iadd_in_place(self):
+        """Test Reaction += modifies the Reaction in place"""
+        reaction = ReactionTerm(self.h2o, -1) + ReactionTerm(self.co2, 1)
+        alias = reaction
+        assert reaction.reactants == [self.h2o]
+
+        reaction += ReactionTerm(self.ch4, -1)
+        reaction += self.h2o
+        reaction += reaction
+
+        assert reaction is alias
+        assert reaction.stoichiometry == {self.co2: 2, self.ch4: -2}
+        assert reaction.reactants == [self.ch4]
+        assert reaction.products == [self.co2]
+        with pytest.raises(TypeError):
+            reaction += 1
+
     def test_reaction_term_invalid_operations(self):
         """Test ReactionTerm with invalid types"""
         term = ReactionTerm(self.h2o, -1)
@@ -198,12 +298,12 @@ class TestReaction:
     """Tests for Reaction class"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self, test_fchk_path, test_tab_path):
+    def setup_method(self, demo_species):
         """Set up test species"""
-        self.h2o = Species("H2O", 18.015, test_fchk_path, test_tab_path)
-        self.co2 = Species("CO2", 44.01, test_fchk_path, test_tab_path)
-        self.ch4 = Species("CH4", 16.04, test_fchk_path, test_tab_path)
-        self.o2 = Species("O2", 32.0, test_fchk_path, test_tab_path)
+        self.h2o = demo_species["H2O"]
+        self.co2 = demo_species["CO2"]
+        self.ch4 = demo_species["CH4"]
+        self.o2 = demo_species["O2"]
 
     def test_reaction_initialization_empty(self, test_fchk_path, test_tab_path):
         """Test empty Reaction initialization"""
@@ -363,71 +463,49 @@ class TestComplexStoichiometryReconstruction:
     """Test reconstruction of the complex stoichiometry system"""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self, test_fchk_path, test_tab_path):
+    def setup_method(self, system_species):
         """Set up all species needed for the complex stoichiometry"""
-        self.species = {}
-        species_names = [
-            'Substrate', 'Nucleophilic', 'ITS1', 'ITS2', 'ITS3', 'ITS4',
-            'Product1', 'Product2', 'Product3', 'LeavingGroup'
+        self.species = system_species
+
+    @pytest.mark.parametrize(
+        "reaction_name, target_dict", list(TARGET_STOICH.items())
+    )
+    def test_reconstruct_target_stoichiometry(
+            self, reaction_name, target_dict
+    ):
+        """Reconstruct the target stoichiometry using ReactionTerms"""
+        terms = [
+            ReactionTerm(self.species[species_name], coeff)
+            for species_name, coeff in target_dict.items()
+        ]
+        reconstructed = Reaction.from_terms(terms, name=reaction_name)
+
+        assert reconstructed.name == reaction_name
+        assert len(reconstructed.stoichiometry) == len(target_dict)
+
+        for species_name, target_coeff in target_dict.items():
+            species = self.species[species_name]
+            assert species in reconstructed.stoichiometry
+            assert reconstructed.stoichiometry[species] == target_coeff
+
+    def test_from_terms_matches_chain(self):
+        """Test Reaction.from_terms equals chaining the terms with +"""
+        terms = [
+            ReactionTerm(self.species['Substrate'], -1),
+            ReactionTerm(self.species['Nucleophilic'], -1),
+            ReactionTerm(self.species['ITS1'], 1),
+            ReactionTerm(self.species['Substrate'], 1),
         ]
 
-        for name in species_names:
-            self.species[name] = Species(
-                name, 100.0,
-                test_fchk_path,
-                test_tab_path,
-            )
-
-    def test_reconstruct_target_stoichiometry(self, test_fchk_path, test_tab_path):
-        """Reconstruct the target stoichiometry using ReactionTerms"""
-        target_stoich = {
-            'R1_fwd': {'Substrate': -1, 'Nucleophilic': -1, 'ITS1': 1},
-            'R1_rev': {'ITS1': -1, 'Substrate': 1, 'Nucleophilic': 1},
-            'R2_fwd': {'Substrate': -1, 'Nucleophilic': -1, 'ITS2': 1},
-            'R2_rev': {'ITS2': -1, 'Substrate': 1, 'Nucleophilic': 1},
-            'R3_fwd': {'Product2': -1, 'Nucleophilic': -1, 'ITS3': 1},
-            'R3_rev': {'ITS3': -1, 'Product2': 1, 'Nucleophilic': 1},
-            'R4_fwd': {'Product1': -1, 'Nucleophilic': -1, 'ITS4': 1},
-            'R4_rev': {'ITS4': -1, 'Product1': 1, 'Nucleophilic': 1},
-            'R5_fwd': {'ITS1': -1, 'Product1': 1, 'LeavingGroup': 1},
-            'R5_rev': {'Product1': -1, 'LeavingGroup': -1, 'ITS1': 1},
-            'R6_fwd': {'ITS2': -1, 'Product2': 1, 'LeavingGroup': 1},
-            'R6_rev': {'Product2': -1, 'LeavingGroup': -1, 'ITS2': 1},
-            'R7_fwd': {'ITS3': -1, 'Product3': 1, 'LeavingGroup': 1},
-            'R7_rev': {'Product3': -1, 'LeavingGroup': -1, 'ITS3': 1},
-            'R8_fwd': {'ITS4': -1, 'Product3': 1, 'LeavingGroup': 1},
-            'R8_rev': {'Product3': -1, 'LeavingGroup': -1, 'ITS1': 1}, # Note: R8_rev uses ITS1 as per original
-        }
-
-        reconstructed_reactions = {}
-
-        for reaction_name, stoich_dict in target_stoich.items():
-            terms = []
-            for species_name, coeff in stoich_dict.items():
-                species = self.species[species_name]
-                terms.append(ReactionTerm(species, coeff))
-
-            if not terms:
-                reaction = Reaction()
-            else:
-                reaction = ReactionTerm(terms[0].species, 0)
-                for term in terms:
-                    reaction = reaction + term
-
-
-            reaction.name = reaction_name
-            reconstructed_reactions[reaction_name] = reaction
-
-        for reaction_name, target_dict in target_stoich.items():
-            reconstructed = reconstructed_reactions[reaction_name]
-
-            assert len(reconstructed.stoichiometry) == len(target_dict)
-
-            for species_name, target_coeff in target_dict.items():
-                species = self.species[species_name]
-                assert species in reconstructed.stoichiometry
-                assert reconstructed.stoichiometry[species] == target_coeff
+        reaction = terms[0]
+        for term in terms[1:]:
+            reaction += term
 
+        from_terms = Reaction.from_terms(terms, name="R")
+        assert from_terms.name == "R"
+        assert from_terms.stoichiometry == reaction.stoichiometry
+        assert self.species['Substrate'] not in from_terms.stoichiometry
+        assert Reaction.from_terms([]).stoichiometry == {}
 
     def test_alternative_reaction_construction(self, test_fchk_path, test_tab_path):
         """Test alternative ways to construct reactions"""
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ispareto.species import (
+    Species,
+    Reaction,
+    ReactionTerm,
+)
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def system_species(system_1_reaction_rows, test_fchk_path, test_tab_path):
+    """Species of all system 1 reactions by name"""
+    names = {
+        name
+        for _, added, subtracted, _ in system_1_reaction_rows
+        for name in added + subtracted
+    }
+    return {
+        name: Species(name, 100.0, test_fchk_path, test_tab_path)
+        for name in names
+    }
+
+
+def _build_all_reactions(
+        species: dict[str, Species],
+        reaction_rows: tuple[tuple[str, tuple, tuple, str], ...],
+) -> list[Reaction]:
+    return [
+        Reaction.from_terms(
+            [ReactionTerm(species[name], 1) for name in added]
+            + [ReactionTerm(species[name], -1) for name in subtracted],
+            name=reaction_name,
+        )
+        for reaction_name, added, subtracted, _ in reaction_rows
+    ]
+
+
+def test_species_add_benchmark(benchmark, system_species):
+    substrate = system_species["Substrate"]
+    nucleophilic = system_species["Nucleophilic"]
+
+    reaction = benchmark(lambda: substrate + nucleophilic)
+
+    assert reaction.stoichiometry == {substrate: 1, nucleophilic: 1}
+
+
+def test_reaction_add_benchmark(benchmark, system_species):
+    reactants = system_species["Substrate"] + system_species["Nucleophilic"]
+    its1 = system_species["ITS1"]
+
+    reaction = benchmark(lambda: reactants + its1)
+
+    assert reaction.stoichiometry[its1] == 1
+
+
+def test_reaction_chain_benchmark(
+        benchmark, system_species, system_1_reaction_rows
+):
+    reactions = benchmark(
+        _build_all_reactions, system_species, system_1_reaction_rows
+    )
+
+    assert len(reactions) == len(system_1_reaction_rows)
@@ -0,0 +1,67 @@
+import pytest
+
+from ispareto.species import Species, TransitionState
+from ispareto.utils import ReactionInput
+
+
+class TestReactionInput:
+
+    def test_missing_files_reported_together(
+            self, test_fchk_path, test_tab_path, tmp_path
+    ):
+        """Test a missing FCHK and a missing TAB file are reported in one
+        error
+        """
+        missing_fchk_path = tmp_path / "missing.fchk"
+        missing_tab_path = tmp_path / "missing.tab"
+        substrate = Species(
+            "Substrate", 100.0, missing_fchk_path, test_tab_path
+        )
+        product = Species("Product", 100.0, test_fchk_path, test_tab_path)
+        reaction = product - substrate
+        reaction.transition_state = TransitionState(
+            "TS", test_fchk_path, missing_tab_path
+        )
+
+        with pytest.raises(FileNotFoundError) as error:
+            ReactionInput([reaction])
+
+        assert f"FCHK File not found: {missing_fchk_path}" in str(error.value)
+        assert f"TAB File not found: {missing_tab_path}" in str(error.value)
+
+    def test_existing_files(self, test_fchk_path, test_tab_path):
+        """Test the species sets are collected when all files exist"""
+        substrate = Species("Substrate", 100.0, test_fchk_path, test_tab_path)
+        product = Species("Product", 100.0, test_fchk_path, test_tab_path)
+        transition_state = TransitionState(
+            "TS", test_fchk_path, test_tab_path
+        )
+        reaction = product - substrate
+        reaction.transition_state = transition_state
+
+        reaction_input = ReactionInput([reaction])
+
+        assert reaction_input.species == {substrate, product}
+        assert reaction_input.transition_states == {transition_state}
+
+    def test_species_fixed_on_construction(
+            self, test_fchk_path, test_tab_path
+    ):
+        """Test the species are collected on construction, a later +=
+        on a reaction does not update them
+        """
+        substrate = Species("Substrate", 100.0, test_fchk_path, test_tab_path)
+        product = Species("Product", 100.0, test_fchk_path, test_tab_path)
+        by_product = Species(
+            "ByProduct", 100.0, test_fchk_path, test_tab_path
+        )
+        reaction = product - substrate
+        reaction.transition_state = TransitionState(
+            "TS", test_fchk_path, test_tab_path
+        )
+        reaction_input = ReactionInput([reaction])
+
+        reaction += by_product
+
+        assert by_product in reaction.stoichiometry
+        assert reaction_input.species == {substrate, product}